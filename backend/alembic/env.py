@@ -54,6 +54,8 @@ async def run_migrations_online() -> None:
     configuration = config.get_section(config.config_ini_section) or {}
     configuration["sqlalchemy.url"] = get_database_url()
 
+    # NullPool is right for a one-shot migration run only; the app engine in
+    # app/db/session.py keeps a connection pool.
     connectable = async_engine_from_config(
         configuration,
         prefix="sqlalchemy.",
@@ -0,0 +1,30 @@
+"""default created_at/updated_at to now() for inserts that leave them out"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0002"
+down_revision = "20260123_0001"
+branch_labels = None
+depends_on = None
+
+_TIMESTAMP_COLUMNS = (
+    ("campaigns", "created_at"),
+    ("campaigns", "updated_at"),
+    ("leads", "created_at"),
+    ("leads", "updated_at"),
+)
+
+
+def upgrade() -> None:
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
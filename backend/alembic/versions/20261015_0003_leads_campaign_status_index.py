@@ -0,0 +1,19 @@
+"""index leads by (campaign_id, status) for stats"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0003"
+down_revision = "20261015_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_leads_campaign_status", "leads", ["campaign_id", "status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_leads_campaign_status", table_name="leads")
@@ -0,0 +1,37 @@
+"""store leads.call_history as jsonb"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0004"
+down_revision = "20261015_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The json default cannot be cast in place; swap it around the type change
+    op.alter_column("leads", "call_history", server_default=None)
+    op.alter_column(
+        "leads",
+        "call_history",
+        type_=postgresql.JSONB(),
+        postgresql_using="call_history::jsonb",
+    )
+    op.alter_column("leads", "call_history", server_default=sa.text("'[]'::jsonb"))
+
+
+def downgrade() -> None:
+    op.alter_column("leads", "call_history", server_default=None)
+    op.alter_column(
+        "leads",
+        "call_history",
+        type_=sa.JSON(),
+        postgresql_using="call_history::json",
+    )
+    op.alter_column("leads", "call_history", server_default=sa.text("'[]'::json"))
@@ -1,9 +1,14 @@
 """Auth API endpoints."""
 
+import asyncio
+import hashlib
+import time
 from typing import Annotated, Any
 
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from jose import JWTError, jwt
 
 from app.schemas.auth import Token, TokenRefreshRequest, TokenRefreshResponse, UserResponse
 from app.services.auth_service import (
@@ -19,15 +24,60 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# Verified tokens: digest -> (expires_at, payload, user). Raw tokens are never stored,
+# and invalid tokens are never cached.
+TOKEN_CACHE_TTL_SECONDS = 30
+_token_cache: TTLCache[bytes, tuple[float, dict[str, Any], dict[str, Any]]] = TTLCache(
+    maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS
+)
+
+
+# User records by username; shared by every token the user holds. Unknown users
+# are not cached.
+USER_CACHE_TTL_SECONDS = 60
+_user_cache: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=5000, ttl=USER_CACHE_TTL_SECONDS)
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
+def _get_cached_user(username: str) -> dict[str, Any] | None:
+    user = _user_cache.get(username)
+    if user is None:
+        user = get_user(username)
+        if user is not None:
+            _user_cache[username] = user
+    return user
+
+
+def _is_expired(token: str, now: float) -> bool:
+    """Check exp without verifying the signature; a forged exp can only get a token rejected."""
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+    except JWTError:
+        return False
+    return isinstance(exp, int | float) and exp <= now
+
 
 async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> dict[str, Any]:
     """Get current user from JWT token."""
+    cache_key = _token_cache_key(token)
+    now = time.time()
+    cached = _token_cache.get(cache_key)
+    if cached is not None and cached[0] > now:
+        return cached[2]
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    # Stale tokens are common (idle tabs); reject them before the signature check
+    if _is_expired(token, now):
+        raise credentials_exception
+
     payload = verify_access_token(token)
     if payload is None:
         raise credentials_exception
@@ -36,10 +86,14 @@ async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> dic
     if username is None:
         raise credentials_exception
 
-    user = get_user(username)
+    user = _get_cached_user(username)
     if user is None:
         raise credentials_exception
 
+    # Never serve a cached entry past the token's own expiry
+    expires_at = min(now + TOKEN_CACHE_TTL_SECONDS, float(payload.get("exp", now)))
+    _token_cache[cache_key] = (expires_at, payload, user)
+
     return user
 
 
@@ -50,7 +104,8 @@ async def login(form_data: Annotated[OAuth2PasswordRequestForm, Depends()]) -> T
 
     Returns access and refresh tokens.
     """
-    user = authenticate_user(form_data.username, form_data.password)
+    # Password hashing is CPU-bound; keep it off the event loop
+    user = await asyncio.to_thread(authenticate_user, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
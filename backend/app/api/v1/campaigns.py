@@ -1,15 +1,17 @@
 """Campaign API endpoints."""
 
-from datetime import UTC, datetime
-from typing import Annotated, Any
-
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
-from pydantic import BaseModel
-from sqlalchemy import func, select
+import asyncio
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Annotated, Any, NoReturn
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, UploadFile, status
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import bindparam, exists, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.auth import get_current_user
-from app.db.models import CampaignDB, LeadDB
+from app.db.models import CAMPAIGN_STATS_STMT, CampaignDB, LeadDB
 from app.db.session import get_session
 from app.models.campaign import Campaign, CampaignStatus
 from app.models.lead import Lead, LeadStatus
@@ -20,10 +22,19 @@ from app.schemas.campaign import (
     LeadCreate,
     LeadResponse,
 )
-from app.services.csv_parser import parse_csv
+from app.services.csv_parser import CSVParseResult, iter_csv_batches
 
 router = APIRouter(prefix="/campaigns", tags=["campaigns"])
 
+# Upper bound on leads returned by one list_leads call
+MAX_LEADS_PAGE_SIZE = 1000
+
+# Serializers for the list endpoints. These return the JSON bytes themselves, so
+# FastAPI does not revalidate each item against response_model; response_model
+# is still declared for the OpenAPI schema.
+_CAMPAIGN_LIST_ADAPTER = TypeAdapter(list[CampaignResponse])
+_LEAD_LIST_ADAPTER = TypeAdapter(list[LeadResponse])
+
 # Legacy in-memory store (kept for backward-compatible tests)
 CAMPAIGNS_DB: dict[str, Campaign] = {}
 
@@ -32,19 +43,17 @@ def _utc_now() -> datetime:
     return datetime.now(UTC)
 
 
-def _status_value(status: CampaignStatus | str) -> str:
-    if isinstance(status, CampaignStatus):
-        return status.value
-    return str(status)
-
-
 def _campaign_to_response(campaign: CampaignDB, lead_count: int) -> CampaignResponse:
-    """Convert Campaign DB model to response schema."""
-    return CampaignResponse(
+    """
+    Convert Campaign DB model to response schema.
+
+    The row was loaded from our own schema, so validation is skipped.
+    """
+    return CampaignResponse.model_construct(
         id=campaign.id,
         name=campaign.name,
         description=campaign.description,
-        status=_status_value(campaign.status),
+        status=campaign.status,
         dial_ratio=campaign.dial_ratio,
         caller_id=campaign.caller_id,
         lead_count=lead_count,
@@ -55,62 +64,61 @@ def _campaign_to_response(campaign: CampaignDB, lead_count: int) -> CampaignResp
     )
 
 
-def _lead_to_response(lead: LeadDB) -> LeadResponse:
-    """Convert Lead DB model to response schema."""
-    status_value = lead.status.value if hasattr(lead.status, "value") else str(lead.status)
-    return LeadResponse(
-        id=lead.id,
-        phone_number=lead.phone_number,
-        name=lead.name,
-        company=lead.company,
-        email=lead.email,
-        status=status_value,
-        outcome=lead.outcome,
-        retry_count=lead.retry_count,
-        created_at=lead.created_at,
-        last_called_at=lead.last_called_at,
-    )
+# Only the columns LeadResponse needs; skips notes, fail_reason and the JSON
+# call_history when listing leads
+_LEAD_RESPONSE_COLUMNS = (
+    LeadDB.id,
+    LeadDB.phone_number,
+    LeadDB.name,
+    LeadDB.company,
+    LeadDB.email,
+    LeadDB.status,
+    LeadDB.outcome,
+    LeadDB.retry_count,
+    LeadDB.created_at,
+    LeadDB.last_called_at,
+)
 
 
 def _raise_transition_error(
     status_value: CampaignStatus,
     action: str,
     reason: str | None = None,
-) -> None:
+) -> NoReturn:
     detail = f"Cannot {action} campaign in {status_value.value} status"
     if reason:
         detail += f": {reason}"
     raise HTTPException(status_code=400, detail=detail)
 
 
+# Prebuilt per-campaign lookups; only the bound campaign id changes per call
+_GET_CAMPAIGN_STMT = select(CampaignDB).where(CampaignDB.id == bindparam("campaign_id"))
+
+_GET_CAMPAIGN_WITH_LEAD_COUNT_STMT = (
+    select(CampaignDB, func.count(LeadDB.id))
+    .outerjoin(LeadDB, LeadDB.campaign_id == CampaignDB.id)
+    .where(CampaignDB.id == bindparam("campaign_id"))
+    .group_by(CampaignDB.id)
+)
+
+
 async def _get_campaign(session: AsyncSession, campaign_id: str) -> CampaignDB | None:
-    result = await session.execute(select(CampaignDB).where(CampaignDB.id == campaign_id))
+    result = await session.execute(_GET_CAMPAIGN_STMT, {"campaign_id": campaign_id})
     return result.scalar_one_or_none()
 
 
 async def _get_campaign_with_lead_count(
     session: AsyncSession, campaign_id: str
 ) -> tuple[CampaignDB, int] | None:
-    stmt = (
-        select(CampaignDB, func.count(LeadDB.id))
-        .outerjoin(LeadDB, LeadDB.campaign_id == CampaignDB.id)
-        .where(CampaignDB.id == campaign_id)
-        .group_by(CampaignDB.id)
+    result = await session.execute(
+        _GET_CAMPAIGN_WITH_LEAD_COUNT_STMT, {"campaign_id": campaign_id}
     )
-    result = await session.execute(stmt)
     row = result.first()
     if not row:
         return None
     return row[0], int(row[1])
 
 
-async def _get_lead_count(session: AsyncSession, campaign_id: str) -> int:
-    result = await session.execute(
-        select(func.count(LeadDB.id)).where(LeadDB.campaign_id == campaign_id)
-    )
-    return int(result.scalar_one())
-
-
 @router.post("", response_model=CampaignResponse, status_code=status.HTTP_201_CREATED)
 async def create_campaign(
     campaign_data: CampaignCreate,
@@ -137,24 +145,37 @@ async def create_campaign(
     )
     session.add(campaign_db)
     await session.commit()
-    await session.refresh(campaign_db)
 
     return _campaign_to_response(campaign_db, lead_count=0)
 
 
+# Per-row lead count; a correlated subquery can use ix_leads_campaign_id for each
+# campaign on the page instead of aggregating the whole leads table.
+_CAMPAIGN_LEAD_COUNT = (
+    select(func.count(LeadDB.id))
+    .where(LeadDB.campaign_id == CampaignDB.id)
+    .correlate(CampaignDB)
+    .scalar_subquery()
+)
+
+
 @router.get("", response_model=list[CampaignResponse])
 async def list_campaigns(
     current_user: Annotated[dict[str, Any], Depends(get_current_user)],
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> list[CampaignResponse]:
-    """List all campaigns."""
+    skip: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+) -> Response:
+    """List campaigns, newest first."""
     stmt = (
-        select(CampaignDB, func.count(LeadDB.id))
-        .outerjoin(LeadDB, LeadDB.campaign_id == CampaignDB.id)
-        .group_by(CampaignDB.id)
+        select(CampaignDB, _CAMPAIGN_LEAD_COUNT)
+        .order_by(CampaignDB.created_at.desc())
+        .offset(skip)
+        .limit(limit)
     )
     result = await session.execute(stmt)
-    return [_campaign_to_response(campaign, int(count)) for campaign, count in result.all()]
+    campaigns = [_campaign_to_response(campaign, int(count)) for campaign, count in result.all()]
+    return Response(_CAMPAIGN_LIST_ADAPTER.dump_json(campaigns), media_type="application/json")
 
 
 @router.get("/{campaign_id}", response_model=CampaignResponse)
@@ -171,6 +192,47 @@ async def get_campaign(
     return _campaign_to_response(campaign, lead_count)
 
 
+async def _transition_campaign(
+    session: AsyncSession,
+    campaign_id: str,
+    allowed: tuple[CampaignStatus, ...],
+    action: str,
+    values: dict[str, Any],
+    require_leads: bool = False,
+) -> CampaignResponse:
+    """
+    Apply a status transition in a single guarded UPDATE ... RETURNING.
+
+    The status guard (and lead check for start) lives in the WHERE clause, so the
+    transition is atomic. Only when no row matches do we re-read the campaign to
+    report why.
+    """
+    lead_count = (
+        select(func.count(LeadDB.id)).where(LeadDB.campaign_id == campaign_id).scalar_subquery()
+    )
+    stmt = (
+        update(CampaignDB)
+        .where(CampaignDB.id == campaign_id, CampaignDB.status.in_(allowed))
+        .values(**values)
+        .returning(CampaignDB, lead_count)
+    )
+    if require_leads:
+        stmt = stmt.where(exists().where(LeadDB.campaign_id == campaign_id))
+
+    row = (await session.execute(stmt)).first()
+    if row is None:
+        campaign = await _get_campaign(session, campaign_id)
+        if not campaign:
+            raise HTTPException(status_code=404, detail="Campaign not found")
+        if campaign.status not in allowed:
+            _raise_transition_error(campaign.status, action)
+        _raise_transition_error(campaign.status, action, "no leads in campaign")
+
+    await session.commit()
+    campaign, count = row
+    return _campaign_to_response(campaign, lead_count=int(count))
+
+
 @router.post("/{campaign_id}/start", response_model=CampaignResponse)
 async def start_campaign(
     campaign_id: str,
@@ -178,25 +240,15 @@ async def start_campaign(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> CampaignResponse:
     """Start a campaign."""
-    campaign = await _get_campaign(session, campaign_id)
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
-
-    if campaign.status != CampaignStatus.DRAFT:
-        _raise_transition_error(campaign.status, "start")
-
-    lead_count = await _get_lead_count(session, campaign_id)
-    if lead_count == 0:
-        _raise_transition_error(campaign.status, "start", "no leads in campaign")
-
     now = _utc_now()
-    campaign.status = CampaignStatus.RUNNING
-    campaign.started_at = now
-    campaign.updated_at = now
-    await session.commit()
-    await session.refresh(campaign)
-
-    return _campaign_to_response(campaign, lead_count=lead_count)
+    return await _transition_campaign(
+        session,
+        campaign_id,
+        (CampaignStatus.DRAFT,),
+        "start",
+        {"status": CampaignStatus.RUNNING, "started_at": now, "updated_at": now},
+        require_leads=True,
+    )
 
 
 @router.post("/{campaign_id}/pause", response_model=CampaignResponse)
@@ -206,21 +258,13 @@ async def pause_campaign(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> CampaignResponse:
     """Pause a running campaign."""
-    campaign = await _get_campaign(session, campaign_id)
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
-
-    if campaign.status != CampaignStatus.RUNNING:
-        _raise_transition_error(campaign.status, "pause")
-
-    now = _utc_now()
-    campaign.status = CampaignStatus.PAUSED
-    campaign.updated_at = now
-    await session.commit()
-    await session.refresh(campaign)
-
-    lead_count = await _get_lead_count(session, campaign_id)
-    return _campaign_to_response(campaign, lead_count=lead_count)
+    return await _transition_campaign(
+        session,
+        campaign_id,
+        (CampaignStatus.RUNNING,),
+        "pause",
+        {"status": CampaignStatus.PAUSED, "updated_at": _utc_now()},
+    )
 
 
 @router.post("/{campaign_id}/resume", response_model=CampaignResponse)
@@ -230,21 +274,13 @@ async def resume_campaign(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> CampaignResponse:
     """Resume a paused campaign."""
-    campaign = await _get_campaign(session, campaign_id)
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
-
-    if campaign.status != CampaignStatus.PAUSED:
-        _raise_transition_error(campaign.status, "resume")
-
-    now = _utc_now()
-    campaign.status = CampaignStatus.RUNNING
-    campaign.updated_at = now
-    await session.commit()
-    await session.refresh(campaign)
-
-    lead_count = await _get_lead_count(session, campaign_id)
-    return _campaign_to_response(campaign, lead_count=lead_count)
+    return await _transition_campaign(
+        session,
+        campaign_id,
+        (CampaignStatus.PAUSED,),
+        "resume",
+        {"status": CampaignStatus.RUNNING, "updated_at": _utc_now()},
+    )
 
 
 @router.post("/{campaign_id}/stop", response_model=CampaignResponse)
@@ -254,21 +290,13 @@ async def stop_campaign(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> CampaignResponse:
     """Stop a campaign."""
-    campaign = await _get_campaign(session, campaign_id)
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
-
-    if campaign.status not in [CampaignStatus.RUNNING, CampaignStatus.PAUSED]:
-        _raise_transition_error(campaign.status, "stop")
-
-    now = _utc_now()
-    campaign.status = CampaignStatus.STOPPED
-    campaign.updated_at = now
-    await session.commit()
-    await session.refresh(campaign)
-
-    lead_count = await _get_lead_count(session, campaign_id)
-    return _campaign_to_response(campaign, lead_count=lead_count)
+    return await _transition_campaign(
+        session,
+        campaign_id,
+        (CampaignStatus.RUNNING, CampaignStatus.PAUSED),
+        "stop",
+        {"status": CampaignStatus.STOPPED, "updated_at": _utc_now()},
+    )
 
 
 @router.get("/{campaign_id}/stats", response_model=CampaignStatsResponse)
@@ -278,47 +306,22 @@ async def get_campaign_stats(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> CampaignStatsResponse:
     """Get campaign statistics."""
-    campaign = await _get_campaign(session, campaign_id)
-    if not campaign:
+    result = await session.execute(CAMPAIGN_STATS_STMT, {"campaign_id": campaign_id})
+    row = result.first()
+    if not row:
         raise HTTPException(status_code=404, detail="Campaign not found")
-
-    stmt = (
-        select(LeadDB.status, func.count(LeadDB.id))
-        .where(LeadDB.campaign_id == campaign_id)
-        .group_by(LeadDB.status)
-    )
-    result = await session.execute(stmt)
-
-    pending = calling = connected = completed = failed = dnc = 0
-    total = 0
-
-    for status_value, count in result.all():
-        count = int(count)
-        total += count
-        status = status_value if isinstance(status_value, LeadStatus) else LeadStatus(status_value)
-        if status == LeadStatus.PENDING:
-            pending += count
-        elif status == LeadStatus.CALLING:
-            calling += count
-        elif status == LeadStatus.CONNECTED:
-            connected += count
-        elif status == LeadStatus.COMPLETED:
-            completed += count
-        elif status == LeadStatus.FAILED:
-            failed += count
-        elif status == LeadStatus.DNC:
-            dnc += count
+    counts = row._mapping
 
     abandon_rate = 0.0
 
     return CampaignStatsResponse(
-        total_leads=total,
-        pending_leads=pending,
-        calling_leads=calling,
-        connected_leads=connected,
-        completed_leads=completed,
-        failed_leads=failed,
-        dnc_leads=dnc,
+        total_leads=counts["total"],
+        pending_leads=counts[LeadStatus.PENDING.value],
+        calling_leads=counts[LeadStatus.CALLING.value],
+        connected_leads=counts[LeadStatus.CONNECTED.value],
+        completed_leads=counts[LeadStatus.COMPLETED.value],
+        failed_leads=counts[LeadStatus.FAILED.value],
+        dnc_leads=counts[LeadStatus.DNC.value],
         abandon_rate=abandon_rate,
     )
 
@@ -333,13 +336,6 @@ async def add_lead(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> LeadResponse:
     """Add a lead to a campaign."""
-    campaign = await _get_campaign(session, campaign_id)
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
-
-    if campaign.status in [CampaignStatus.STOPPED, CampaignStatus.COMPLETED]:
-        _raise_transition_error(campaign.status, "add lead")
-
     try:
         lead = Lead(
             phone_number=lead_data.phone_number,
@@ -351,43 +347,50 @@ async def add_lead(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
-    existing = await session.execute(
-        select(LeadDB.id).where(
-            LeadDB.campaign_id == campaign_id, LeadDB.phone_number == lead.phone_number
+    # Touch the campaign only if it still accepts leads; the UPDATE doubles as the
+    # existence/status check and holds the row lock until the insert commits.
+    touched = await session.execute(
+        update(CampaignDB)
+        .where(
+            CampaignDB.id == campaign_id,
+            CampaignDB.status.not_in((CampaignStatus.STOPPED, CampaignStatus.COMPLETED)),
         )
+        .values(updated_at=_utc_now())
+        .returning(CampaignDB.id)
     )
-    if existing.scalar_one_or_none():
+    if touched.first() is None:
+        campaign = await _get_campaign(session, campaign_id)
+        if not campaign:
+            raise HTTPException(status_code=404, detail="Campaign not found")
+        _raise_transition_error(campaign.status, "add lead")
+
+    row: dict[str, Any] = {
+        "id": lead.id,
+        "campaign_id": campaign_id,
+        "phone_number": lead.phone_number,
+        "name": lead.name,
+        "company": lead.company,
+        "email": lead.email,
+        "notes": lead.notes,
+        "status": lead.status,
+        "outcome": lead.outcome,
+        "fail_reason": lead.fail_reason,
+        "retry_count": lead.retry_count,
+        "max_retries": lead.max_retries,
+        "created_at": lead.created_at,
+        "updated_at": lead.updated_at,
+        "last_called_at": lead.last_called_at,
+        "call_history": lead.call_history,
+    }
+    if not await LeadDB.bulk_insert(session, [row]):
+        await session.rollback()
         raise HTTPException(
             status_code=400,
             detail=f"Phone number {lead.phone_number} already exists in campaign",
         )
-
-    lead_db = LeadDB(
-        id=lead.id,
-        campaign_id=campaign_id,
-        phone_number=lead.phone_number,
-        name=lead.name,
-        company=lead.company,
-        email=lead.email,
-        notes=lead.notes,
-        status=lead.status,
-        outcome=lead.outcome,
-        fail_reason=lead.fail_reason,
-        retry_count=lead.retry_count,
-        max_retries=lead.max_retries,
-        created_at=lead.created_at,
-        updated_at=lead.updated_at,
-        last_called_at=lead.last_called_at,
-        call_history=lead.call_history,
-    )
-
-    now = _utc_now()
-    campaign.updated_at = now
-    session.add(lead_db)
     await session.commit()
-    await session.refresh(lead_db)
 
-    return _lead_to_response(lead_db)
+    return LeadResponse.model_validate(row)
 
 
 @router.get("/{campaign_id}/leads", response_model=list[LeadResponse])
@@ -395,17 +398,70 @@ async def list_leads(
     campaign_id: str,
     current_user: Annotated[dict[str, Any], Depends(get_current_user)],
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> list[LeadResponse]:
-    """List all leads in a campaign."""
-    campaign = await _get_campaign(session, campaign_id)
-    if not campaign:
+    skip: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=MAX_LEADS_PAGE_SIZE)] = MAX_LEADS_PAGE_SIZE,
+) -> Response:
+    """List leads in a campaign, oldest first, one page at a time."""
+    result = await session.execute(
+        select(*_LEAD_RESPONSE_COLUMNS)
+        .where(LeadDB.campaign_id == campaign_id)
+        .order_by(LeadDB.created_at, LeadDB.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    rows = result.all()
+
+    # Leads imply the campaign exists; only an empty page needs the extra lookup
+    if not rows and not await _get_campaign(session, campaign_id):
         raise HTTPException(status_code=404, detail="Campaign not found")
 
-    result = await session.execute(
-        select(LeadDB).where(LeadDB.campaign_id == campaign_id).order_by(LeadDB.created_at)
+    # One pass in pydantic-core from rows to JSON bytes
+    leads = _LEAD_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    return Response(_LEAD_LIST_ADAPTER.dump_json(leads), media_type="application/json")
+
+
+async def _import_lead_batch(
+    session: AsyncSession, campaign_id: str, batch: CSVParseResult, created_at: datetime
+) -> tuple[int, list[dict[str, str]]]:
+    """
+    Insert one parsed CSV batch.
+
+    Phone numbers were already validated by the CSV parser, so rows are built
+    directly without a Lead domain object per row; status, retry counters and
+    call history take their column defaults. Row i is stamped created_at + i
+    microseconds so list_leads returns leads in file order.
+
+    Returns the number of leads inserted and the errors for the batch.
+    """
+    rows = []
+    for offset, parsed_lead in enumerate(batch.leads):
+        stamp = created_at + timedelta(microseconds=offset)
+        rows.append(
+            {
+                "id": str(uuid.uuid4()),
+                "campaign_id": campaign_id,
+                "phone_number": parsed_lead.phone_number,
+                "name": parsed_lead.name,
+                "company": parsed_lead.company,
+                "email": parsed_lead.email,
+                "notes": parsed_lead.notes,
+                "created_at": stamp,
+                "updated_at": stamp,
+            }
+        )
+    inserted_ids = await LeadDB.bulk_insert(session, rows)
+
+    # Rows the database skipped collided with an existing (or earlier) phone number
+    errors = list(batch.errors)
+    errors.extend(
+        {
+            "phone": row["phone_number"],
+            "error": f"Phone number {row['phone_number']} already exists in campaign",
+        }
+        for row in rows
+        if row["id"] not in inserted_ids
     )
-    leads = result.scalars().all()
-    return [_lead_to_response(lead) for lead in leads]
+    return len(inserted_ids), errors
 
 
 class ImportResult(BaseModel):
@@ -441,72 +497,31 @@ async def import_leads(
     if campaign.status in [CampaignStatus.STOPPED, CampaignStatus.COMPLETED]:
         _raise_transition_error(campaign.status, "add lead")
 
-    content = await file.read()
-
+    # Parse straight from the spooled upload, one batch of rows at a time. Decoding,
+    # CSV parsing and phone validation are CPU-bound (and the spool may be on disk),
+    # so each batch is pulled in a worker thread to keep the event loop free.
+    await file.seek(0)
+    batches = iter_csv_batches(file.file)
     try:
-        result = parse_csv(content)
+        batch = await asyncio.to_thread(next, batches, None)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
-    existing_numbers = set(
-        (
-            await session.execute(
-                select(LeadDB.phone_number).where(LeadDB.campaign_id == campaign_id)
-            )
-        )
-        .scalars()
-        .all()
-    )
-
     imported_count = 0
     skipped_count = 0
-    errors = list(result.errors)
-
-    for parsed_lead in result.leads:
-        if parsed_lead.phone_number in existing_numbers:
-            skipped_count += 1
-            errors.append(
-                {
-                    "phone": parsed_lead.phone_number,
-                    "error": f"Phone number {parsed_lead.phone_number} already exists in campaign",
-                }
-            )
-            continue
-
-        try:
-            lead = Lead(
-                phone_number=parsed_lead.phone_number,
-                name=parsed_lead.name,
-                company=parsed_lead.company,
-                email=parsed_lead.email,
-                notes=parsed_lead.notes,
-            )
-        except ValueError as e:
-            skipped_count += 1
-            errors.append({"phone": parsed_lead.phone_number, "error": str(e)})
-            continue
-
-        lead_db = LeadDB(
-            id=lead.id,
-            campaign_id=campaign_id,
-            phone_number=lead.phone_number,
-            name=lead.name,
-            company=lead.company,
-            email=lead.email,
-            notes=lead.notes,
-            status=lead.status,
-            outcome=lead.outcome,
-            fail_reason=lead.fail_reason,
-            retry_count=lead.retry_count,
-            max_retries=lead.max_retries,
-            created_at=lead.created_at,
-            updated_at=lead.updated_at,
-            last_called_at=lead.last_called_at,
-            call_history=lead.call_history,
+    errors: list[dict[str, str]] = []
+    created_at = _utc_now()
+
+    while batch is not None:
+        batch_imported, batch_errors = await _import_lead_batch(
+            session, campaign_id, batch, created_at
         )
-        session.add(lead_db)
-        existing_numbers.add(parsed_lead.phone_number)
-        imported_count += 1
+        # Next batch starts after this one's last stamp, even if the clock hasn't moved on
+        created_at = max(_utc_now(), created_at + timedelta(microseconds=len(batch.leads)))
+        imported_count += batch_imported
+        skipped_count += len(batch.leads) - batch_imported + len(batch.errors)
+        errors.extend(batch_errors)
+        batch = await asyncio.to_thread(next, batches, None)
 
     if imported_count > 0:
         campaign.updated_at = _utc_now()
@@ -515,6 +530,6 @@ async def import_leads(
 
     return ImportResult(
         imported_count=imported_count,
-        skipped_count=skipped_count + len(result.errors),
+        skipped_count=skipped_count,
         errors=errors,
     )
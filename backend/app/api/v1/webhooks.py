@@ -2,12 +2,31 @@
 
 # ruff: noqa: N803
 
+import logging
+from xml.sax.saxutils import escape
+
 from fastapi import APIRouter, Form, Response
 
+logger = logging.getLogger(__name__)
+
+
 router = APIRouter(prefix="/webhooks/twilio", tags=["webhooks"])
 
 
-def twiml_response(content: str) -> Response:
+# Static TwiML documents, encoded once at import
+_EMPTY_TWIML = b'<?xml version="1.0" encoding="UTF-8"?><Response></Response>'
+_HANGUP_TWIML = b'<?xml version="1.0" encoding="UTF-8"?><Response><Hangup/></Response>'
+_PAUSE_TWIML = b'<?xml version="1.0" encoding="UTF-8"?><Response><Pause length="1"/></Response>'
+
+# Human-answer TwiML around the conference room name room-{CallSid}
+_CONFERENCE_TWIML_PREFIX = (
+    b'<?xml version="1.0" encoding="UTF-8"?><Response><Dial>'
+    b'<Conference beep="false" startConferenceOnEnter="true" endConferenceOnExit="true">room-'
+)
+_CONFERENCE_TWIML_SUFFIX = b"</Conference></Dial></Response>"
+
+
+def twiml_response(content: str | bytes) -> Response:
     """Create a TwiML XML response."""
     return Response(
         content=content,
@@ -39,16 +58,16 @@ async def call_status_webhook(
     - canceled: Call was canceled
     """
     # Log the status (in production, update DB)
-    print(f"Call {CallSid}: {CallStatus}")
+    logger.info("Call %s: %s", CallSid, CallStatus)
 
     if ErrorCode:
-        print(f"  Error: {ErrorCode} - {ErrorMessage}")
+        logger.warning("Call %s error: %s - %s", CallSid, ErrorCode, ErrorMessage)
 
     if CallDuration:
-        print(f"  Duration: {CallDuration}s")
+        logger.info("Call %s duration: %ss", CallSid, CallDuration)
 
     # Return empty TwiML
-    return twiml_response('<?xml version="1.0" encoding="UTF-8"?><Response></Response>')
+    return twiml_response(_EMPTY_TWIML)
 
 
 @router.post("/amd")
@@ -68,39 +87,16 @@ async def amd_webhook(
     - fax: Fax machine detected
     - unknown: Could not determine
     """
-    print(f"AMD result for {CallSid}: {AnsweredBy}")
+    logger.info("AMD result for %s: %s", CallSid, AnsweredBy)
 
     if AnsweredBy == "human":
         # Human answered - connect to operator via conference
-        return twiml_response('''<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Dial>
-        <Conference beep="false" startConferenceOnEnter="true" endConferenceOnExit="true">
-            room-{CallSid}
-        </Conference>
-    </Dial>
-</Response>'''.replace("{CallSid}", CallSid))
-
-    elif AnsweredBy in ("machine_start", "machine_end_beep", "machine_end_silence", "machine_end_other"):
-        # Machine - hang up
-        return twiml_response('''<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Hangup/>
-</Response>''')
-
-    elif AnsweredBy == "fax":
-        # Fax - hang up
-        return twiml_response('''<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Hangup/>
-</Response>''')
-
-    else:
-        # Unknown - could try to connect anyway or hang up
-        return twiml_response('''<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Hangup/>
-</Response>''')
+        # Twilio SIDs are ASCII alphanumerics; escaping only guards against forged input
+        room = escape(CallSid).encode("ascii", "xmlcharrefreplace")
+        return twiml_response(_CONFERENCE_TWIML_PREFIX + room + _CONFERENCE_TWIML_SUFFIX)
+
+    # Machine (machine_start / machine_end_*), fax or unknown - hang up
+    return twiml_response(_HANGUP_TWIML)
 
 
 @router.post("/voice")
@@ -115,11 +111,8 @@ async def voice_webhook(
     This is the initial webhook when a call is answered.
     Returns TwiML instructions for the call.
     """
-    print(f"Voice webhook: {CallSid} from {From} to {To}")
+    logger.info("Voice webhook: %s from %s to %s", CallSid, From, To)
 
     # For outbound predictive dialing, we use AMD first
     # This TwiML enables machine detection
-    return twiml_response('''<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Pause length="1"/>
-</Response>''')
+    return twiml_response(_PAUSE_TWIML)
@@ -9,20 +9,33 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    bindparam,
+    func,
+    select,
 )
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
 from app.models.campaign import CampaignStatus
 from app.models.lead import LeadStatus
 
+# Rows per INSERT statement in bulk inserts
+BULK_INSERT_BATCH_SIZE = 1000
+
+# ON CONFLICT support lives on the dialect-specific insert constructs
+_DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
 
 def utc_now() -> datetime:
-    """Timezone-aware UTC now for defaults."""
+    """Timezone-aware UTC now, for timestamps set explicitly from Python."""
     return datetime.now(UTC)
 
 
@@ -42,9 +55,14 @@ class CampaignDB(Base):
     dial_ratio: Mapped[float] = mapped_column(Float, default=3.0, nullable=False)
     caller_id: Mapped[str | None] = mapped_column(String(32), nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
+    # The app stamps created_at/updated_at itself: responses are built without a
+    # refresh and lead import order relies on distinct stamps. The server
+    # defaults are only a fallback for writers outside the app (scripts, SQL).
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -61,6 +79,8 @@ class LeadDB(Base):
     __tablename__ = "leads"
     __table_args__ = (
         UniqueConstraint("campaign_id", "phone_number", name="uq_leads_campaign_phone"),
+        # Per-campaign status counts (stats) without touching the heap
+        Index("ix_leads_campaign_status", "campaign_id", "status"),
     )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
@@ -88,12 +108,65 @@ class LeadDB(Base):
     retry_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     max_retries: Mapped[int] = mapped_column(Integer, default=3, nullable=False)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
+    # Stamped by the app like CampaignDB's; the server defaults are a fallback
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
     last_called_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
-    call_history: Mapped[list[dict[str, Any]]] = mapped_column(JSON, default=list, nullable=False)
+    # Stored as jsonb on Postgres: parsed once on write instead of on every read
+    call_history: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), default=list, nullable=False
+    )
 
     campaign: Mapped[CampaignDB] = relationship(back_populates="leads")
+
+    @classmethod
+    async def bulk_insert(cls, session: AsyncSession, rows: list[dict[str, Any]]) -> set[str]:
+        """
+        Insert lead rows without the ORM unit of work, skipping duplicate phone numbers.
+
+        Rows are sent BULK_INSERT_BATCH_SIZE at a time; the unique constraint on
+        (campaign_id, phone_number) drops duplicates of existing rows and of
+        earlier rows in the same call.
+
+        Returns:
+            Ids of the rows that were actually inserted
+        """
+        dialect_insert = _DIALECT_INSERTS[session.get_bind().dialect.name]
+        stmt = (
+            dialect_insert(cls)
+            .on_conflict_do_nothing(index_elements=["campaign_id", "phone_number"])
+            .returning(cls.id)
+        )
+        inserted: set[str] = set()
+        for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+            result = await session.execute(stmt, rows[start : start + BULK_INSERT_BATCH_SIZE])
+            inserted.update(result.scalars().all())
+        return inserted
+
+
+# Campaign stats in one query: the campaign's id, name and status, its lead
+# total, and one COUNT(...) FILTER (WHERE status = ...) column per lead status,
+# labelled by value. Counting the non-null status column (not id) lets Postgres
+# answer from ix_leads_campaign_status with an index-only scan.
+_LEAD_STATUS_COUNTS = [
+    func.count(LeadDB.status).filter(LeadDB.status == status).label(status.value)
+    for status in LeadStatus
+]
+
+CAMPAIGN_STATS_STMT = (
+    select(
+        CampaignDB.id,
+        CampaignDB.name,
+        CampaignDB.status,
+        func.count(LeadDB.status).label("total"),
+        *_LEAD_STATUS_COUNTS,
+    )
+    .outerjoin(LeadDB, LeadDB.campaign_id == CampaignDB.id)
+    .where(CampaignDB.id == bindparam("campaign_id"))
+    .group_by(CampaignDB.id)
+)
@@ -2,26 +2,60 @@
 
 from collections.abc import AsyncIterator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.config import get_settings
 
-settings = get_settings()
-
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-)
-
-AsyncSessionLocal = async_sessionmaker(
-    bind=engine,
-    expire_on_commit=False,
-    class_=AsyncSession,
-)
+# Created on first use (normally lifespan startup) rather than at import
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def get_engine() -> AsyncEngine:
+    """Get the application engine, creating it on first call."""
+    global _engine
+    if _engine is None:
+        settings = get_settings()
+        # Pooled connections: requests borrow an open connection instead of paying a
+        # TCP/auth handshake each time. (Alembic's env.py uses NullPool on purpose.)
+        _engine = create_async_engine(
+            settings.database_url,
+            echo=settings.debug,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_pre_ping=True,
+            pool_recycle=settings.db_pool_recycle_seconds,
+        )
+    return _engine
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the session factory bound to the application engine."""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(
+            bind=get_engine(),
+            expire_on_commit=False,
+            class_=AsyncSession,
+        )
+    return _session_factory
+
+
+async def dispose_engine() -> None:
+    """Close pooled connections; the next get_engine() call starts a new engine."""
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_factory = None
 
 
 async def get_session() -> AsyncIterator[AsyncSession]:
     """FastAPI dependency to provide an async DB session."""
-    async with AsyncSessionLocal() as session:
+    async with get_session_factory()() as session:
         yield session
-
@@ -0,0 +1,42 @@
+"""Application logging setup."""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+def start_queue_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Route the app's log records through a queue to a background writer thread.
+
+    Request handlers only enqueue records; formatting and stream I/O happen on
+    the listener thread, so logging never blocks the event loop.
+
+    Returns:
+        The started listener; pass it to stop_queue_logging on shutdown
+    """
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(level)
+    app_logger.addHandler(QueueHandler(log_queue))
+    app_logger.propagate = False
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def stop_queue_logging(listener: QueueListener) -> None:
+    """Flush queued records and detach the queue handler."""
+    listener.stop()
+
+    app_logger = logging.getLogger("app")
+    for handler in [h for h in app_logger.handlers if isinstance(h, QueueHandler)]:
+        app_logger.removeHandler(handler)
+    app_logger.propagate = True
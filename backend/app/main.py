@@ -1,25 +1,43 @@
 """FastAPI application entry point."""
 
+import asyncio
+import logging
 from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1 import auth, campaigns, webhooks
 from app.config import get_settings
+from app.db.session import dispose_engine, get_engine
+from app.logging_config import start_queue_logging, stop_queue_logging
 from app.websocket import dashboard_ws, operator_ws
 
+logger = logging.getLogger(__name__)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan handler."""
     # Startup
     settings = get_settings()
-    print(f"Starting {settings.app_name}...")
+    log_listener = start_queue_logging(logging.DEBUG if settings.debug else logging.INFO)
+    logger.info("Starting %s...", settings.app_name)
+    # asyncio.to_thread uses the loop's default executor; FastAPI's sync
+    # dependencies use anyio's limiter. Size both from the same setting.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.thread_pool_size, thread_name_prefix="worker")
+    )
+    to_thread.current_default_thread_limiter().total_tokens = settings.thread_pool_size
+    get_engine()
     yield
     # Shutdown
-    print("Shutting down...")
+    logger.info("Shutting down...")
+    await dispose_engine()
+    stop_queue_logging(log_listener)
 
 
 def create_app() -> FastAPI:
@@ -36,7 +54,7 @@ def create_app() -> FastAPI:
     # CORS middleware
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["http://localhost:5173"],  # Vite dev server
+        allow_origins=settings.cors_origins,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
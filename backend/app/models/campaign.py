@@ -1,9 +1,11 @@
 """Campaign domain model."""
 
 import uuid
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
+from itertools import islice
 from typing import Any
 
 from app.models.lead import Lead, LeadStatus
@@ -32,7 +34,7 @@ class InvalidCampaignStateError(Exception):
         super().__init__(message)
 
 
-@dataclass
+@dataclass(slots=True)
 class CampaignStats:
     """Campaign statistics."""
 
@@ -58,7 +60,7 @@ class CampaignStats:
         return self.abandoned_leads / total_answered
 
 
-@dataclass
+@dataclass(slots=True)
 class Campaign:
     """
     Campaign (キャンペーン) domain model.
@@ -77,9 +79,13 @@ class Campaign:
     dial_ratio: float = 3.0  # 同時発信数 / 待機オペレーター数
     caller_id: str | None = None  # 発信元電話番号
 
-    # Leads
-    leads: list[Lead] = field(default_factory=list)
-    _phone_numbers: set[str] = field(default_factory=set)  # 重複チェック用
+    # Leads in insertion order, keyed by id (see the leads property); the other
+    # indexes are kept in step with lead status changes (see _index_lead)
+    _by_id: dict[str, Lead] = field(default_factory=dict, repr=False)
+    _by_phone: dict[str, Lead] = field(default_factory=dict, repr=False)  # 重複チェック用
+    # Insertion-ordered set of PENDING leads; a retried lead rejoins at the back
+    _pending: dict[str, Lead] = field(default_factory=dict, repr=False)
+    _status_counts: Counter[LeadStatus] = field(default_factory=Counter, repr=False)
 
     # Timestamps
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
@@ -95,9 +101,39 @@ class Campaign:
         if self.dial_ratio <= 0:
             raise ValueError("Dial ratio must be positive")
 
-    def _update_timestamp(self) -> None:
-        """Update the updated_at timestamp."""
-        self.updated_at = datetime.now(UTC)
+    @property
+    def leads(self) -> list[Lead]:
+        """All leads in the order they were added (a new list on every access)."""
+        return list(self._by_id.values())
+
+    def _update_timestamp(self, now: datetime | None = None) -> None:
+        """Update the updated_at timestamp, reusing ``now`` when the caller already read the clock."""
+        self.updated_at = now if now is not None else datetime.now(UTC)
+
+    def _index_lead(self, lead: Lead) -> None:
+        """Add a lead to the id/phone/pending/status indexes and track its status changes."""
+        self._by_id[lead.id] = lead
+        self._by_phone[lead.phone_number] = lead
+        self._status_counts[lead.status] += 1
+        if lead.status == LeadStatus.PENDING:
+            self._pending[lead.id] = lead
+        lead._status_listener = self._on_lead_status_change
+
+    def _unindex_lead(self, lead: Lead) -> None:
+        """Remove a lead from the indexes and stop tracking it."""
+        lead._status_listener = None
+        del self._by_id[lead.id]
+        del self._by_phone[lead.phone_number]
+        self._status_counts[lead.status] -= 1
+        self._pending.pop(lead.id, None)
+
+    def _on_lead_status_change(self, lead: Lead, old_status: LeadStatus) -> None:
+        self._status_counts[old_status] -= 1
+        self._status_counts[lead.status] += 1
+        if old_status == LeadStatus.PENDING:
+            self._pending.pop(lead.id, None)
+        if lead.status == LeadStatus.PENDING:
+            self._pending[lead.id] = lead
 
     def add_lead(self, lead: Lead) -> None:
         """
@@ -113,31 +149,67 @@ class Campaign:
         if self.status in [CampaignStatus.STOPPED, CampaignStatus.COMPLETED]:
             raise InvalidCampaignStateError(self.status, "add lead")
 
-        if lead.phone_number in self._phone_numbers:
+        if lead.phone_number in self._by_phone:
             raise ValueError(f"Phone number {lead.phone_number} already exists in campaign")
 
         lead.campaign_id = self.id
-        self.leads.append(lead)
-        self._phone_numbers.add(lead.phone_number)
+        self._index_lead(lead)
         self._update_timestamp()
 
+    def add_leads(self, leads: list[Lead]) -> tuple[int, list[dict[str, str]]]:
+        """
+        Add many leads at once, skipping duplicate phone numbers.
+
+        Unlike add_lead, duplicates are reported instead of raised, and the
+        timestamp is updated once for the whole batch.
+
+        Args:
+            leads: Leads to add
+
+        Returns:
+            Number of leads added and an error entry per skipped lead
+
+        Raises:
+            InvalidCampaignStateError: If campaign is stopped or completed
+        """
+        if self.status in [CampaignStatus.STOPPED, CampaignStatus.COMPLETED]:
+            raise InvalidCampaignStateError(self.status, "add lead")
+
+        added = 0
+        errors: list[dict[str, str]] = []
+        for lead in leads:
+            if lead.phone_number in self._by_phone:
+                errors.append(
+                    {
+                        "phone": lead.phone_number,
+                        "error": f"Phone number {lead.phone_number} already exists in campaign",
+                    }
+                )
+                continue
+            lead.campaign_id = self.id
+            self._index_lead(lead)
+            added += 1
+
+        if added:
+            self._update_timestamp()
+        return added, errors
+
     def remove_lead(self, lead_id: str) -> Lead | None:
         """
         Remove a lead from the campaign.
 
         Only allowed for PENDING leads.
         """
-        for i, lead in enumerate(self.leads):
-            if lead.id == lead_id:
-                if lead.status != LeadStatus.PENDING:
-                    raise InvalidCampaignStateError(
-                        self.status, "remove lead", "can only remove pending leads"
-                    )
-                removed = self.leads.pop(i)
-                self._phone_numbers.discard(removed.phone_number)
-                self._update_timestamp()
-                return removed
-        return None
+        lead = self._by_id.get(lead_id)
+        if lead is None:
+            return None
+        if lead.status != LeadStatus.PENDING:
+            raise InvalidCampaignStateError(
+                self.status, "remove lead", "can only remove pending leads"
+            )
+        self._unindex_lead(lead)
+        self._update_timestamp()
+        return lead
 
     def get_next_lead(self) -> Lead | None:
         """
@@ -148,10 +220,7 @@ class Campaign:
         if self.status != CampaignStatus.RUNNING:
             return None
 
-        for lead in self.leads:
-            if lead.status == LeadStatus.PENDING:
-                return lead
-        return None
+        return next(iter(self._pending.values()), None)
 
     def get_callable_leads(self, count: int) -> list[Lead]:
         """
@@ -166,13 +235,7 @@ class Campaign:
         if self.status != CampaignStatus.RUNNING:
             return []
 
-        callable_leads = []
-        for lead in self.leads:
-            if lead.status == LeadStatus.PENDING:
-                callable_leads.append(lead)
-                if len(callable_leads) >= count:
-                    break
-        return callable_leads
+        return list(islice(self._pending.values(), max(count, 0)))
 
     def start(self) -> None:
         """
@@ -183,12 +246,13 @@ class Campaign:
         if self.status != CampaignStatus.DRAFT:
             raise InvalidCampaignStateError(self.status, "start")
 
-        if not self.leads:
+        if not self._by_id:
             raise InvalidCampaignStateError(self.status, "start", "no leads in campaign")
 
         self.status = CampaignStatus.RUNNING
-        self.started_at = datetime.now(UTC)
-        self._update_timestamp()
+        now = datetime.now(UTC)
+        self.started_at = now
+        self._update_timestamp(now)
 
     def pause(self) -> None:
         """
@@ -236,13 +300,14 @@ class Campaign:
             return False
 
         # Check if all leads are in terminal states
-        for lead in self.leads:
-            if lead.status in [LeadStatus.PENDING, LeadStatus.CALLING, LeadStatus.CONNECTED]:
-                return False
+        counts = self._status_counts
+        if counts[LeadStatus.PENDING] or counts[LeadStatus.CALLING] or counts[LeadStatus.CONNECTED]:
+            return False
 
         self.status = CampaignStatus.COMPLETED
-        self.completed_at = datetime.now(UTC)
-        self._update_timestamp()
+        now = datetime.now(UTC)
+        self.completed_at = now
+        self._update_timestamp(now)
         return True
 
     def update_dial_ratio(self, new_ratio: float) -> None:
@@ -260,27 +325,20 @@ class Campaign:
 
     def get_stats(self) -> CampaignStats:
         """Calculate current campaign statistics."""
-        stats = CampaignStats(total_leads=len(self.leads))
-
-        for lead in self.leads:
-            match lead.status:
-                case LeadStatus.PENDING:
-                    stats.pending_leads += 1
-                case LeadStatus.CALLING:
-                    stats.calling_leads += 1
-                case LeadStatus.CONNECTED:
-                    stats.connected_leads += 1
-                case LeadStatus.COMPLETED:
-                    stats.completed_leads += 1
-                case LeadStatus.FAILED:
-                    stats.failed_leads += 1
-                case LeadStatus.DNC:
-                    stats.dnc_leads += 1
-
-        return stats
+        counts = self._status_counts
+        return CampaignStats(
+            total_leads=len(self._by_id),
+            pending_leads=counts[LeadStatus.PENDING],
+            calling_leads=counts[LeadStatus.CALLING],
+            connected_leads=counts[LeadStatus.CONNECTED],
+            completed_leads=counts[LeadStatus.COMPLETED],
+            failed_leads=counts[LeadStatus.FAILED],
+            dnc_leads=counts[LeadStatus.DNC],
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
+        stats = self.get_stats()
         return {
             "id": self.id,
             "name": self.name,
@@ -288,15 +346,15 @@ class Campaign:
             "status": self.status.value,
             "dial_ratio": self.dial_ratio,
             "caller_id": self.caller_id,
-            "lead_count": len(self.leads),
+            "lead_count": len(self._by_id),
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "stats": {
-                "total": self.get_stats().total_leads,
-                "pending": self.get_stats().pending_leads,
-                "completed": self.get_stats().completed_leads,
-                "failed": self.get_stats().failed_leads,
+                "total": stats.total_leads,
+                "pending": stats.pending_leads,
+                "completed": stats.completed_leads,
+                "failed": stats.failed_leads,
             },
         }
@@ -2,6 +2,7 @@
 
 import re
 import uuid
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -30,8 +31,10 @@ class InvalidStatusTransitionError(Exception):
         )
 
 
-# E.164 format: + followed by 1-15 digits
-E164_PATTERN = re.compile(r"^\+[1-9]\d{1,14}$")
+# E.164 format: + followed by 2-15 ASCII digits. [0-9] rather than \d (which also
+# matches non-ASCII digits) and \Z rather than $ (which allows a trailing
+# newline); the literal classes also match faster.
+E164_PATTERN = re.compile(r"\+[1-9][0-9]{1,14}\Z")
 
 
 def validate_phone_number(phone: str) -> str:
@@ -43,7 +46,7 @@ def validate_phone_number(phone: str) -> str:
     return phone
 
 
-@dataclass
+@dataclass(slots=True)
 class Lead:
     """
     Lead (見込み客) domain model.
@@ -79,13 +82,27 @@ class Lead:
     # Campaign association
     campaign_id: str | None = None
 
+    # Called as listener(lead, old_status) after every status transition; set by
+    # the owning Campaign to keep its status indexes current. Change status only
+    # through the transition methods so the listener sees it.
+    _status_listener: Callable[["Lead", LeadStatus], None] | None = field(
+        default=None, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         """Validate phone number on creation."""
         self.phone_number = validate_phone_number(self.phone_number)
 
-    def _update_timestamp(self) -> None:
-        """Update the updated_at timestamp."""
-        self.updated_at = datetime.now(UTC)
+    def _set_status(self, status: LeadStatus) -> None:
+        """Change status and report it to the owning campaign, if any."""
+        old_status = self.status
+        self.status = status
+        if self._status_listener is not None and old_status != status:
+            self._status_listener(self, old_status)
+
+    def _update_timestamp(self, now: datetime | None = None) -> None:
+        """Update the updated_at timestamp, reusing ``now`` when the caller already read the clock."""
+        self.updated_at = now if now is not None else datetime.now(UTC)
 
     def _can_transition_from(self, allowed_statuses: list[LeadStatus], action: str) -> None:
         """Check if transition is allowed from current status."""
@@ -99,9 +116,10 @@ class Lead:
         Only allowed from PENDING status.
         """
         self._can_transition_from([LeadStatus.PENDING], "start_calling")
-        self.status = LeadStatus.CALLING
-        self.last_called_at = datetime.now(UTC)
-        self._update_timestamp()
+        self._set_status(LeadStatus.CALLING)
+        now = datetime.now(UTC)
+        self.last_called_at = now
+        self._update_timestamp(now)
 
     def connect(self) -> None:
         """
@@ -110,7 +128,7 @@ class Lead:
         Only allowed from CALLING status (after AMD detects human).
         """
         self._can_transition_from([LeadStatus.CALLING], "connect")
-        self.status = LeadStatus.CONNECTED
+        self._set_status(LeadStatus.CONNECTED)
         self._update_timestamp()
 
     def complete(self, outcome: str) -> None:
@@ -123,10 +141,9 @@ class Lead:
             outcome: Result of the call (e.g., "interested", "not_interested", "callback")
         """
         self._can_transition_from([LeadStatus.CONNECTED], "complete")
-        self.status = LeadStatus.COMPLETED
+        self._set_status(LeadStatus.COMPLETED)
         self.outcome = outcome
-        self._record_call_attempt(outcome=outcome)
-        self._update_timestamp()
+        self._update_timestamp(self._record_call_attempt(outcome=outcome))
 
     def fail(self, reason: str) -> None:
         """
@@ -138,10 +155,9 @@ class Lead:
             reason: Why the call failed (e.g., "no_answer", "busy", "machine", "invalid_number")
         """
         self._can_transition_from([LeadStatus.CALLING], "fail")
-        self.status = LeadStatus.FAILED
+        self._set_status(LeadStatus.FAILED)
         self.fail_reason = reason
-        self._record_call_attempt(reason=reason)
-        self._update_timestamp()
+        self._update_timestamp(self._record_call_attempt(reason=reason))
 
     def retry(self) -> None:
         """
@@ -154,7 +170,7 @@ class Lead:
         if self.retry_count >= self.max_retries:
             raise InvalidStatusTransitionError(self.status, "retry (max retries reached)")
 
-        self.status = LeadStatus.PENDING
+        self._set_status(LeadStatus.PENDING)
         self.retry_count += 1
         self.fail_reason = None
         self._update_timestamp()
@@ -169,13 +185,14 @@ class Lead:
         if self.status == LeadStatus.DNC:
             return  # Already DNC, no-op
 
-        self.status = LeadStatus.DNC
+        self._set_status(LeadStatus.DNC)
         self._update_timestamp()
 
-    def _record_call_attempt(self, outcome: str | None = None, reason: str | None = None) -> None:
-        """Record a call attempt in history."""
+    def _record_call_attempt(self, outcome: str | None = None, reason: str | None = None) -> datetime:
+        """Record a call attempt in history and return its timestamp."""
+        now = datetime.now(UTC)
         record: dict[str, Any] = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": now.isoformat(),
             "attempt_number": len(self.call_history) + 1,
         }
         if outcome:
@@ -184,6 +201,7 @@ class Lead:
             record["reason"] = reason
 
         self.call_history.append(record)
+        return now
 
     def can_be_called(self) -> bool:
         """Check if this lead can be called."""
@@ -2,7 +2,10 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.models.campaign import CampaignStatus
+from app.models.lead import LeadStatus
 
 
 class CampaignCreate(BaseModel):
@@ -17,10 +20,12 @@ class CampaignCreate(BaseModel):
 class CampaignResponse(BaseModel):
     """Campaign response."""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     id: str
     name: str
     description: str
-    status: str
+    status: CampaignStatus
     dial_ratio: float
     caller_id: str | None
     lead_count: int
@@ -46,7 +51,9 @@ class CampaignStatsResponse(BaseModel):
 class LeadCreate(BaseModel):
     """Lead creation request."""
 
-    phone_number: str = Field(..., pattern=r"^\+[1-9]\d{1,14}$")
+    # Same rule as app.models.lead.E164_PATTERN, in the syntax of pydantic-core's
+    # regex engine (\d there matches any Unicode digit, so use [0-9])
+    phone_number: str = Field(..., pattern=r"^\+[1-9][0-9]{1,14}$")
     name: str | None = None
     company: str | None = None
     email: str | None = None
@@ -56,12 +63,14 @@ class LeadCreate(BaseModel):
 class LeadResponse(BaseModel):
     """Lead response."""
 
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+
     id: str
     phone_number: str
     name: str | None
     company: str | None
     email: str | None
-    status: str
+    status: LeadStatus
     outcome: str | None
     retry_count: int
     created_at: datetime
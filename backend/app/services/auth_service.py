@@ -1,22 +1,18 @@
 """Authentication service."""
 
-import hashlib
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any, cast
 
-from jose import JWTError, jwt
+import bcrypt
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 
 from app.config import get_settings
 
-
-def _simple_hash(password: str) -> str:
-    """Simple SHA256 hash for development (replace with bcrypt in production)."""
-    return hashlib.sha256(password.encode()).hexdigest()
-
-
-def _simple_verify(plain: str, hashed: str) -> bool:
-    """Verify simple hash."""
-    return _simple_hash(plain) == hashed
+# bcrypt only looks at the first 72 bytes and rejects longer input
+BCRYPT_MAX_PASSWORD_BYTES = 72
+BCRYPT_ROUNDS = 12
 
 
 # In-memory user store (replace with DB in production)
@@ -25,7 +21,8 @@ USERS_DB: dict[str, dict[str, Any]] = {
         "id": "user-001",
         "username": "admin",
         "email": "admin@example.com",
-        "hashed_password": _simple_hash("admin123"),
+        # bcrypt("admin123"); precomputed so importing the module does no hashing
+        "hashed_password": "$2b$10$pIB3scS8svCnhogpsT9H8OaRRJbMayK3.EVIu4.86pwTcqJKjksnS",
         "role": "admin",
         "is_active": True,
     },
@@ -33,7 +30,8 @@ USERS_DB: dict[str, dict[str, Any]] = {
         "id": "user-002",
         "username": "operator1",
         "email": "op1@example.com",
-        "hashed_password": _simple_hash("operator123"),
+        # bcrypt("operator123")
+        "hashed_password": "$2b$10$imQCZt2V7uGN7vvuKTw2f.jEHIYLI6kRUtaAArdJK0EDyGvW6aH8K",
         "role": "operator",
         "is_active": True,
     },
@@ -41,13 +39,24 @@ USERS_DB: dict[str, dict[str, Any]] = {
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return _simple_verify(plain_password, hashed_password)
+    """Verify a password against its bcrypt hash."""
+    password = plain_password.encode()
+    if len(password) > BCRYPT_MAX_PASSWORD_BYTES:
+        return False
+    return bcrypt.checkpw(password, hashed_password.encode())
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password."""
-    return _simple_hash(password)
+    """
+    Hash a password with bcrypt.
+
+    Raises:
+        ValueError: If the password is longer than 72 bytes
+    """
+    encoded = password.encode()
+    if len(encoded) > BCRYPT_MAX_PASSWORD_BYTES:
+        raise ValueError(f"Password must be at most {BCRYPT_MAX_PASSWORD_BYTES} bytes")
+    return bcrypt.hashpw(encoded, bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
 
 
 def get_user(username: str) -> dict[str, Any] | None:
@@ -65,6 +74,12 @@ def authenticate_user(username: str, password: str) -> dict[str, Any] | None:
     return user
 
 
+@lru_cache(maxsize=1)
+def _get_signing_key(secret_key: str, algorithm: str) -> Key:
+    """Build the JWK once; passing the raw secret makes jose rebuild it per token."""
+    return jwk.construct(secret_key, algorithm)
+
+
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token."""
     settings = get_settings()
@@ -76,7 +91,8 @@ def create_access_token(data: dict[str, Any], expires_delta: timedelta | None =
         expire = datetime.now(UTC) + timedelta(minutes=settings.access_token_expire_minutes)
 
     to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    key = _get_signing_key(settings.secret_key, settings.algorithm)
+    encoded_jwt = jwt.encode(to_encode, key, algorithm=settings.algorithm)
     return cast(str, encoded_jwt)
 
 
@@ -88,7 +104,8 @@ def create_refresh_token(data: dict[str, Any]) -> str:
     expire = datetime.now(UTC) + timedelta(days=settings.refresh_token_expire_days)
     to_encode.update({"exp": expire, "type": "refresh"})
 
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    key = _get_signing_key(settings.secret_key, settings.algorithm)
+    encoded_jwt = jwt.encode(to_encode, key, algorithm=settings.algorithm)
     return cast(str, encoded_jwt)
 
 
@@ -96,7 +113,8 @@ def decode_token(token: str) -> dict[str, Any] | None:
     """Decode and validate a JWT token."""
     settings = get_settings()
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        key = _get_signing_key(settings.secret_key, settings.algorithm)
+        payload = jwt.decode(token, key, algorithms=[settings.algorithm])
         return cast(dict[str, Any], payload)
     except JWTError:
         return None
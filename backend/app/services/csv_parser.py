@@ -1,12 +1,16 @@
 """CSV parsing service with encoding detection."""
 
+import codecs
 import csv
 import io
-import re
+from collections.abc import Iterator
 from dataclasses import dataclass
+from typing import BinaryIO
 
+from app.models.lead import E164_PATTERN
 
-@dataclass
+
+@dataclass(slots=True)
 class ParsedLead:
     """Parsed lead from CSV."""
 
@@ -25,96 +29,157 @@ class CSVParseResult:
     errors: list[dict[str, str]]
 
 
-E164_PATTERN = re.compile(r"^\+[1-9]\d{1,14}$")
+# Bytes sampled from the head of a stream for encoding detection
+ENCODING_SAMPLE_SIZE = 64 * 1024
 
+# Rows per batch yielded by iter_csv_batches
+DEFAULT_BATCH_SIZE = 1000
 
-def detect_encoding(content: bytes) -> str:
-    """Detect encoding of CSV content."""
-    # Try UTF-8 first
-    try:
-        content.decode("utf-8")
-        return "utf-8"
-    except UnicodeDecodeError:
-        pass
+# Byte order marks, checked before any trial decoding. The utf-16 codec consumes
+# its own BOM; utf-8-sig strips the UTF-8 one so it does not end up in the header.
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
 
-    # Try Shift_JIS (common in Japan)
-    try:
-        content.decode("shift_jis")
-        return "shift_jis"
-    except UnicodeDecodeError:
-        pass
 
-    # Try CP932 (Windows Japanese)
+def _decodes_as(content: bytes, encoding: str, partial: bool) -> bool:
     try:
-        content.decode("cp932")
-        return "cp932"
+        codecs.getincrementaldecoder(encoding)().decode(content, final=not partial)
+        return True
     except UnicodeDecodeError:
-        pass
-
-    # Default to UTF-8 with error handling
-    return "utf-8"
+        return False
 
 
-def parse_csv(content: bytes) -> CSVParseResult:
+def detect_encoding(content: bytes, partial: bool = False) -> str:
     """
-    Parse CSV content with automatic encoding detection.
+    Detect encoding of CSV content.
 
     Args:
         content: Raw CSV bytes
-
-    Returns:
-        CSVParseResult with parsed leads and any errors
+        partial: True if content is only the head of the file (a multi-byte
+            character cut off at the end is then not treated as an error)
     """
-    if not content or not content.strip():
-        raise ValueError("Empty CSV file")
+    for bom, encoding in _BOM_ENCODINGS:
+        if content.startswith(bom):
+            return encoding
 
-    encoding = detect_encoding(content)
-    text = content.decode(encoding, errors="replace")
+    # Try UTF-8 first, then Shift_JIS (common in Japan), then CP932 (Windows Japanese)
+    for encoding in ("utf-8", "shift_jis", "cp932"):
+        if _decodes_as(content, encoding, partial):
+            return encoding
 
-    # Parse CSV
-    reader = csv.DictReader(io.StringIO(text))
+    # Default to UTF-8 with error handling
+    return "utf-8"
 
-    # Check for required column
-    if reader.fieldnames is None:
-        raise ValueError("Invalid CSV format")
 
-    fieldnames_lower = [f.lower().strip() for f in reader.fieldnames]
-    if "phone_number" not in fieldnames_lower:
-        raise ValueError("Missing required column: phone_number")
+def _cell(row: list[str], index: int | None) -> str | None:
+    """Stripped cell value, or None if the column is absent, short or blank."""
+    if index is None or index >= len(row):
+        return None
+    return row[index].strip() or None
 
-    # Map column names (case-insensitive)
-    column_map = {f.lower().strip(): f for f in reader.fieldnames}
 
-    leads: list[ParsedLead] = []
-    errors: list[dict[str, str]] = []
+def iter_csv_batches(
+    stream: BinaryIO, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[CSVParseResult]:
+    """
+    Parse CSV from a binary stream, yielding results in batches of rows.
 
-    for row_num, row in enumerate(reader, start=2):  # Start at 2 (1 is header)
-        phone_key = column_map.get("phone_number")
-        phone = row.get(phone_key, "").strip() if phone_key else ""
+    The stream is decoded lazily, so memory use is bounded by batch_size rather
+    than by the file size. Encoding is detected from the head of the stream.
 
-        # Validate phone number
-        if not phone:
-            errors.append({"row": str(row_num), "error": "Empty phone number"})
-            continue
+    Args:
+        stream: Seekable binary stream positioned at the start of the CSV
+        batch_size: Maximum number of data rows per yielded batch
 
-        if not E164_PATTERN.match(phone):
-            errors.append({"row": str(row_num), "error": f"Invalid phone format: {phone}"})
-            continue
+    Raises:
+        ValueError: On the first iteration, if the file is empty or the header is invalid
+    """
+    start = stream.tell()
+    sample = stream.read(ENCODING_SAMPLE_SIZE)
+    if not sample or not sample.strip():
+        raise ValueError("Empty CSV file")
+    stream.seek(start)
 
-        # Extract optional fields
-        name = row.get(column_map.get("name", ""), "").strip() or None
-        company = row.get(column_map.get("company", ""), "").strip() or None
-        email = row.get(column_map.get("email", ""), "").strip() or None
-        notes = row.get(column_map.get("notes", ""), "").strip() or None
+    encoding = detect_encoding(sample, partial=len(sample) == ENCODING_SAMPLE_SIZE)
+    text = io.TextIOWrapper(stream, encoding=encoding, errors="replace", newline="")
 
-        leads.append(
-            ParsedLead(
-                phone_number=phone,
-                name=name,
-                company=company,
-                email=email,
-                notes=notes,
+    try:
+        # Plain csv.reader: cells are read by column index instead of building a
+        # dict per row as DictReader does
+        reader = csv.reader(text)
+
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("Invalid CSV format")
+
+        # Map column names (case-insensitive) to positions, resolved once before the row loop
+        columns = {name.strip().casefold(): index for index, name in enumerate(header)}
+        phone_index = columns.get("phone_number")
+        if phone_index is None:
+            raise ValueError("Missing required column: phone_number")
+        name_index = columns.get("name")
+        company_index = columns.get("company")
+        email_index = columns.get("email")
+        notes_index = columns.get("notes")
+
+        batch = CSVParseResult(leads=[], errors=[])
+        rows_in_batch = 0
+        row_num = 1  # 1 is header
+
+        for row in reader:
+            if not row:  # Blank line (DictReader skipped these too)
+                continue
+            row_num += 1
+
+            if rows_in_batch == batch_size:
+                yield batch
+                batch = CSVParseResult(leads=[], errors=[])
+                rows_in_batch = 0
+            rows_in_batch += 1
+
+            phone = _cell(row, phone_index) or ""
+
+            # Validate phone number
+            if not phone:
+                batch.errors.append({"row": str(row_num), "error": "Empty phone number"})
+                continue
+
+            if not E164_PATTERN.match(phone):
+                batch.errors.append({"row": str(row_num), "error": f"Invalid phone format: {phone}"})
+                continue
+
+            batch.leads.append(
+                ParsedLead(
+                    phone_number=phone,
+                    name=_cell(row, name_index),
+                    company=_cell(row, company_index),
+                    email=_cell(row, email_index),
+                    notes=_cell(row, notes_index),
+                )
             )
-        )
 
-    return CSVParseResult(leads=leads, errors=errors)
+        if rows_in_batch:
+            yield batch
+    finally:
+        # Leave the caller's stream open
+        text.detach()
+
+
+def parse_csv(content: bytes) -> CSVParseResult:
+    """
+    Parse CSV content with automatic encoding detection.
+
+    Args:
+        content: Raw CSV bytes
+
+    Returns:
+        CSVParseResult with parsed leads and any errors
+    """
+    result = CSVParseResult(leads=[], errors=[])
+    for batch in iter_csv_batches(io.BytesIO(content)):
+        result.leads.extend(batch.leads)
+        result.errors.extend(batch.errors)
+    return result
@@ -1,5 +1,6 @@
 """Dialer orchestrator - predictive dialing algorithm."""
 
+import time
 from dataclasses import dataclass
 from typing import Any
 
@@ -7,7 +8,7 @@ from app.models.campaign import Campaign, CampaignStats, CampaignStatus
 from app.models.lead import Lead
 
 
-@dataclass
+@dataclass(slots=True)
 class DialerConfig:
     """Configuration for the dialer orchestrator."""
 
@@ -16,6 +17,21 @@ class DialerConfig:
     max_dial_ratio: float = 5.0
     target_abandon_rate: float = 0.03  # 3%
 
+    # PID gains for dial ratio control (error = target - current abandon rate)
+    kp: float = 10.0
+    ki: float = 1.0
+    kd: float = 0.0
+    integral_limit: float = 0.2  # Anti-windup bound on the accumulated error (rate * seconds)
+
+
+@dataclass(slots=True)
+class _ControllerState:
+    """Per-campaign PID state carried between ticks."""
+
+    prev_error: float
+    integral: float
+    last_t: float
+
 
 class DialerOrchestrator:
     """
@@ -36,6 +52,10 @@ class DialerOrchestrator:
         min_dial_ratio: float = 1.0,
         max_dial_ratio: float = 5.0,
         target_abandon_rate: float = 0.03,
+        kp: float = 10.0,
+        ki: float = 1.0,
+        kd: float = 0.0,
+        integral_limit: float = 0.2,
     ):
         """
         Initialize the orchestrator.
@@ -45,51 +65,126 @@ class DialerOrchestrator:
             min_dial_ratio: Minimum allowed dial ratio
             max_dial_ratio: Maximum allowed dial ratio
             target_abandon_rate: Target abandon rate (0.03 = 3%)
+            kp: Proportional gain
+            ki: Integral gain
+            kd: Derivative gain
+            integral_limit: Anti-windup bound on the integral term's accumulated error
         """
         self.base_dial_ratio = base_dial_ratio
         self.min_dial_ratio = min_dial_ratio
         self.max_dial_ratio = max_dial_ratio
         self.target_abandon_rate = target_abandon_rate
+        self.kp = kp
+        self.ki = ki
+        self.kd = kd
+        self.integral_limit = integral_limit
+        self._controllers: dict[str, _ControllerState] = {}
+
+    @property
+    def target_abandon_rate(self) -> float:
+        """Target abandon rate (0.03 = 3%)."""
+        return self._target_abandon_rate
+
+    @target_abandon_rate.setter
+    def target_abandon_rate(self, value: float) -> None:
+        # Thresholds derived from the target are precomputed for the per-tick checks
+        self._target_abandon_rate = value
+        self._pause_threshold = value * 2.0
+        self._warn_threshold = value * 1.5
+
+    @classmethod
+    def from_config(cls, config: DialerConfig) -> "DialerOrchestrator":
+        """Create an orchestrator from a DialerConfig."""
+        return cls(
+            base_dial_ratio=config.base_dial_ratio,
+            min_dial_ratio=config.min_dial_ratio,
+            max_dial_ratio=config.max_dial_ratio,
+            target_abandon_rate=config.target_abandon_rate,
+            kp=config.kp,
+            ki=config.ki,
+            kd=config.kd,
+            integral_limit=config.integral_limit,
+        )
+
+    def reset_controller(self, campaign_id: str) -> None:
+        """Forget the PID state of a campaign (e.g. when it stops or completes)."""
+        self._controllers.pop(campaign_id, None)
 
-    def calculate_dial_ratio(self, stats: CampaignStats) -> float:
+    def calculate_dial_ratio(
+        self,
+        stats: CampaignStats,
+        campaign_id: str | None = None,
+        max_ratio: float | None = None,
+    ) -> float:
         """
         Calculate the optimal dial ratio based on current stats.
 
-        Uses a simple proportional control algorithm:
+        Uses a discrete PID controller on the abandon rate error:
         - If abandon rate > target: decrease ratio
         - If abandon rate < target: increase ratio
 
+        With a campaign_id, the integral and derivative terms use state kept
+        from that campaign's previous call; without one only the proportional
+        term applies.
+
         Args:
             stats: Current campaign statistics
+            campaign_id: Campaign whose controller state to use and update
+            max_ratio: Extra cap on the result (e.g. the campaign's own dial ratio)
 
         Returns:
             Calculated dial ratio
         """
-        current_abandon_rate = stats.abandon_rate
-
         # No data yet, use base ratio
         total_calls = stats.connected_leads + stats.abandoned_leads
         if total_calls < 10:
-            return self.base_dial_ratio
-
-        # Calculate adjustment factor
-        # If abandon rate is at target, factor = 1.0
-        # If abandon rate is higher, factor < 1.0 (reduce calls)
-        # If abandon rate is lower, factor > 1.0 (increase calls)
-        if current_abandon_rate > 0:
-            # Proportional adjustment
-            error = self.target_abandon_rate - current_abandon_rate
-            # Scale factor: small adjustments to avoid oscillation
-            adjustment = 1.0 + (error * 10)  # 10x sensitivity
+            ratio = self.base_dial_ratio
+        elif campaign_id is None:
+            ratio = self._clamp_ratio(1.0 + self.kp * self._error(stats))
         else:
-            # No abandons, can increase slightly
-            adjustment = 1.1
-
-        # Apply adjustment to base ratio
-        new_ratio = self.base_dial_ratio * adjustment
-
-        # Clamp to min/max bounds
-        return max(self.min_dial_ratio, min(self.max_dial_ratio, new_ratio))
+            ratio = self._pid_ratio(stats, campaign_id, max_ratio)
+
+        if max_ratio is not None and ratio > max_ratio:
+            return max_ratio
+        return ratio
+
+    def _pid_ratio(self, stats: CampaignStats, campaign_id: str, max_ratio: float | None) -> float:
+        """Advance a campaign's PID controller and return the clamped ratio."""
+        error = self._error(stats)
+        control = self.kp * error
+
+        now = time.monotonic()
+        state = self._controllers.get(campaign_id)
+        if state is None:
+            self._controllers[campaign_id] = _ControllerState(
+                prev_error=error, integral=0.0, last_t=now
+            )
+            return self._clamp_ratio(1.0 + control)
+
+        dt = now - state.last_t
+        if dt > 0:
+            control += self.kd * (error - state.prev_error) / dt
+            limit = self.integral_limit
+            integral = max(-limit, min(limit, state.integral + error * dt))
+            # Conditional integration: while the output is pinned at a bound and
+            # the error pushes further past it, stop accumulating (anti-windup)
+            upper = self.max_dial_ratio if max_ratio is None else min(self.max_dial_ratio, max_ratio)
+            raw = self.base_dial_ratio * (1.0 + control + self.ki * integral)
+            if not ((raw > upper and error > 0) or (raw < self.min_dial_ratio and error < 0)):
+                state.integral = integral
+        control += self.ki * state.integral
+        state.prev_error = error
+        state.last_t = now
+
+        return self._clamp_ratio(1.0 + control)
+
+    def _error(self, stats: CampaignStats) -> float:
+        """Controller error: > 0 below target (dial more), < 0 above target (dial less)."""
+        return self._target_abandon_rate - stats.abandon_rate
+
+    def _clamp_ratio(self, adjustment: float) -> float:
+        """Apply an adjustment factor to the base ratio, clamped to min/max bounds."""
+        return max(self.min_dial_ratio, min(self.max_dial_ratio, self.base_dial_ratio * adjustment))
 
     def calculate_calls_to_make(
         self,
@@ -137,20 +232,20 @@ class DialerOrchestrator:
         Returns:
             List of leads to call
         """
-        # Only dial for running campaigns
+        # Only dial for running campaigns. A paused, stopped or completed campaign
+        # drops its controller state, so a later restart doesn't inherit stale windup
         if campaign.status != CampaignStatus.RUNNING:
+            self.reset_controller(campaign.id)
             return []
 
         # Calculate how many calls to make
         stats = campaign.get_stats()
-        dial_ratio = self.calculate_dial_ratio(stats)
-
-        # Use campaign's configured ratio if different
-        effective_ratio = min(dial_ratio, campaign.dial_ratio)
+        # The campaign's configured ratio caps the controller output
+        dial_ratio = self.calculate_dial_ratio(stats, campaign.id, max_ratio=campaign.dial_ratio)
 
         calls_to_make = self.calculate_calls_to_make(
             available_operators=available_operators,
-            dial_ratio=effective_ratio,
+            dial_ratio=dial_ratio,
             pending_calls=pending_calls,
         )
 
@@ -171,7 +266,7 @@ class DialerOrchestrator:
             True if dialing should be paused
         """
         # Pause if abandon rate exceeds 2x target
-        return stats.abandon_rate > (self.target_abandon_rate * 2)
+        return stats.abandon_rate > self._pause_threshold
 
     def get_dialing_health(self, stats: CampaignStats) -> dict[str, Any]:
         """
@@ -184,11 +279,11 @@ class DialerOrchestrator:
             Dictionary with health metrics
         """
         abandon_rate = stats.abandon_rate
-        target = self.target_abandon_rate
+        target = self._target_abandon_rate
 
         if abandon_rate <= target:
             status = "healthy"
-        elif abandon_rate <= target * 1.5:
+        elif abandon_rate <= self._warn_threshold:
             status = "warning"
         else:
             status = "critical"
@@ -1,7 +1,11 @@
 """Operator management service."""
 
+import bisect
+import itertools
+import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
 
@@ -16,7 +20,7 @@ class OperatorStatus(str, Enum):
     WRAP_UP = "wrap_up"  # 後処理中
 
 
-@dataclass
+@dataclass(slots=True)
 class OperatorSession:
     """
     Operator session state.
@@ -26,7 +30,8 @@ class OperatorSession:
 
     id: str
     name: str
-    status: OperatorStatus = OperatorStatus.OFFLINE
+    # Read and written through the status property, which reports changes
+    _status: OperatorStatus = OperatorStatus.OFFLINE
 
     # Current call info
     current_call_sid: str | None = None
@@ -34,13 +39,39 @@ class OperatorSession:
 
     # Timing
     _idle_since: datetime | None = field(default=None, repr=False)
-    _call_started_at: datetime | None = field(default=None, repr=False)
+    _call_started_at: float | None = field(default=None, repr=False)  # time.monotonic()
     session_started_at: datetime | None = None
 
     # Stats for this session
     calls_handled: int = 0
     total_talk_time_seconds: int = 0
 
+    # Each called as listener(operator, old_status, old_call_sid) after a status
+    # assignment or state transition; registered by the OperatorManager and the
+    # WebSocket session registry holding this session to keep their indexes
+    # current. Call SID and idle time changes are only reported by the
+    # transition methods, so don't assign those fields directly once tracked.
+    _change_listeners: list[Callable[["OperatorSession", OperatorStatus, str | None], None]] = (
+        field(default_factory=list, repr=False, compare=False)
+    )
+
+    @property
+    def status(self) -> OperatorStatus:
+        """Current availability status."""
+        return self._status
+
+    @status.setter
+    def status(self, value: OperatorStatus) -> None:
+        old_status = self._status
+        self._status = value
+        if value != old_status:
+            self._notify(old_status, self.current_call_sid)
+
+    def _notify(self, old_status: OperatorStatus, old_call_sid: str | None) -> None:
+        """Report a finished state change to whoever tracks this session."""
+        for listener in self._change_listeners:
+            listener(self, old_status, old_call_sid)
+
     @property
     def idle_since(self) -> datetime | None:
         """Get the time when operator became idle."""
@@ -53,18 +84,29 @@ class OperatorSession:
             return 0.0
         return (datetime.now(UTC) - self._idle_since).total_seconds()
 
+    def idle_seconds_at(self, now: datetime) -> float:
+        """How long the operator has been idle as of ``now`` (one clock read shared across a listing)."""
+        if self._idle_since is None:
+            return 0.0
+        return (now - self._idle_since).total_seconds()
+
     def go_online(self) -> None:
         """Set operator to available status."""
-        self.status = OperatorStatus.AVAILABLE
-        self._idle_since = datetime.now(UTC)
-        self.session_started_at = datetime.now(UTC)
+        old_status = self._status
+        self._status = OperatorStatus.AVAILABLE
+        now = datetime.now(UTC)
+        self._idle_since = now
+        self.session_started_at = now
+        self._notify(old_status, self.current_call_sid)
 
     def go_offline(self) -> None:
         """Set operator to offline status."""
-        self.status = OperatorStatus.OFFLINE
+        old_status, old_call_sid = self._status, self.current_call_sid
+        self._status = OperatorStatus.OFFLINE
         self._idle_since = None
         self.current_call_sid = None
         self.current_lead_id = None
+        self._notify(old_status, old_call_sid)
 
     def start_call(self, call_sid: str, lead_id: str) -> None:
         """
@@ -74,58 +116,76 @@ class OperatorSession:
             call_sid: The Twilio call SID
             lead_id: The lead being called
         """
-        self.status = OperatorStatus.ON_CALL
+        old_status, old_call_sid = self._status, self.current_call_sid
+        self._status = OperatorStatus.ON_CALL
         self.current_call_sid = call_sid
         self.current_lead_id = lead_id
-        self._call_started_at = datetime.now(UTC)
+        self._call_started_at = time.monotonic()
         self._idle_since = None
+        self._notify(old_status, old_call_sid)
 
     def end_call(self) -> None:
         """End the current call and return to available."""
-        if self._call_started_at:
-            call_duration = (datetime.now(UTC) - self._call_started_at).total_seconds()
+        if self._call_started_at is not None:
+            call_duration = time.monotonic() - self._call_started_at
             self.total_talk_time_seconds += int(call_duration)
             self.calls_handled += 1
 
-        self.status = OperatorStatus.AVAILABLE
+        old_status, old_call_sid = self._status, self.current_call_sid
+        self._status = OperatorStatus.AVAILABLE
         self.current_call_sid = None
         self.current_lead_id = None
         self._call_started_at = None
         self._idle_since = datetime.now(UTC)
+        self._notify(old_status, old_call_sid)
 
     def go_on_break(self) -> None:
         """Set operator to break status."""
-        self.status = OperatorStatus.ON_BREAK
+        old_status = self._status
+        self._status = OperatorStatus.ON_BREAK
         self._idle_since = None
+        self._notify(old_status, self.current_call_sid)
 
     def return_from_break(self) -> None:
         """Return from break to available status."""
-        self.status = OperatorStatus.AVAILABLE
+        old_status = self._status
+        self._status = OperatorStatus.AVAILABLE
         self._idle_since = datetime.now(UTC)
+        self._notify(old_status, self.current_call_sid)
 
     def start_wrap_up(self) -> None:
         """Start wrap-up time after a call."""
-        self.status = OperatorStatus.WRAP_UP
+        old_status = self._status
+        self._status = OperatorStatus.WRAP_UP
         self._idle_since = None
+        self._notify(old_status, self.current_call_sid)
 
     def end_wrap_up(self) -> None:
         """End wrap-up and return to available."""
-        self.status = OperatorStatus.AVAILABLE
+        old_status = self._status
+        self._status = OperatorStatus.AVAILABLE
         self._idle_since = datetime.now(UTC)
+        self._notify(old_status, self.current_call_sid)
 
     def is_available(self) -> bool:
         """Check if operator can receive calls."""
         return self.status == OperatorStatus.AVAILABLE
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for serialization."""
+    def to_dict(self, now: datetime | None = None) -> dict[str, Any]:
+        """
+        Convert to dictionary for serialization.
+
+        Args:
+            now: Reference time for idle_duration_seconds, so a listing of many
+                operators reads the clock once (defaults to the current time)
+        """
         return {
             "id": self.id,
             "name": self.name,
             "status": self.status.value,
             "current_call_sid": self.current_call_sid,
             "current_lead_id": self.current_lead_id,
-            "idle_duration_seconds": self.idle_duration_seconds,
+            "idle_duration_seconds": self.idle_seconds_at(now or datetime.now(UTC)),
             "calls_handled": self.calls_handled,
             "total_talk_time_seconds": self.total_talk_time_seconds,
         }
@@ -153,13 +213,80 @@ class OperatorManager:
         self._operators: dict[str, OperatorSession] = {}
         self.max_idle_seconds = max_idle_seconds
 
+        # Indexes kept in step with operator changes (see _index_operator)
+        self._by_status: dict[OperatorStatus, dict[str, OperatorSession]] = {
+            status: {} for status in OperatorStatus
+        }
+        self._by_call_sid: dict[str, OperatorSession] = {}
+
+        # Available operators with an idle_since, sorted longest idle first as
+        # (idle_since, seq, operator_id); seq breaks ties in insertion order
+        self._idle_order: list[tuple[datetime, int, str]] = []
+        self._idle_entries: dict[str, tuple[datetime, int, str]] = {}
+        self._idle_seq = itertools.count()
+
+    def _index_operator(self, operator: OperatorSession) -> None:
+        """Add an operator to the status/call/idle indexes and track its changes."""
+        self._by_status[operator.status][operator.id] = operator
+        if operator.current_call_sid is not None:
+            self._by_call_sid[operator.current_call_sid] = operator
+        self._reindex_idle(operator)
+        operator._change_listeners.append(self._on_operator_change)
+
+    def _unindex_operator(self, operator: OperatorSession) -> None:
+        """Remove an operator from the indexes and stop tracking it."""
+        operator._change_listeners.remove(self._on_operator_change)
+        self._by_status[operator.status].pop(operator.id, None)
+        if operator.current_call_sid is not None:
+            self._by_call_sid.pop(operator.current_call_sid, None)
+        self._unindex_idle(operator.id)
+
+    def _unindex_idle(self, operator_id: str) -> None:
+        entry = self._idle_entries.pop(operator_id, None)
+        if entry is not None:
+            del self._idle_order[bisect.bisect_left(self._idle_order, entry)]
+
+    def _reindex_idle(self, operator: OperatorSession) -> None:
+        """Re-file an operator in the idle ordering after its status or idle_since changed."""
+        if operator.status == OperatorStatus.AVAILABLE and operator._idle_since is not None:
+            entry = self._idle_entries.get(operator.id)
+            if entry is not None and entry[0] == operator._idle_since:
+                return  # Already filed at this idle_since
+        self._unindex_idle(operator.id)
+        if operator.status == OperatorStatus.AVAILABLE and operator._idle_since is not None:
+            entry = (operator._idle_since, next(self._idle_seq), operator.id)
+            bisect.insort(self._idle_order, entry)
+            self._idle_entries[operator.id] = entry
+
+    def _on_operator_change(
+        self, operator: OperatorSession, old_status: OperatorStatus, old_call_sid: str | None
+    ) -> None:
+        if operator.status != old_status:
+            self._by_status[old_status].pop(operator.id, None)
+            self._by_status[operator.status][operator.id] = operator
+        if operator.current_call_sid != old_call_sid:
+            if old_call_sid is not None and self._by_call_sid.get(old_call_sid) is operator:
+                del self._by_call_sid[old_call_sid]
+            if operator.current_call_sid is not None:
+                self._by_call_sid[operator.current_call_sid] = operator
+        # Transitions into, out of or within AVAILABLE may move idle_since
+        if old_status == OperatorStatus.AVAILABLE or operator.status == OperatorStatus.AVAILABLE:
+            self._reindex_idle(operator)
+
     def add_operator(self, operator: OperatorSession) -> None:
         """Add an operator to the manager."""
+        existing = self._operators.get(operator.id)
+        if existing is not None:
+            self._unindex_operator(existing)
         self._operators[operator.id] = operator
+        self._index_operator(operator)
 
     def remove_operator(self, operator_id: str) -> OperatorSession | None:
         """Remove an operator from the manager."""
-        return self._operators.pop(operator_id, None)
+        operator = self._operators.pop(operator_id, None)
+        if operator is not None:
+            self._unindex_operator(operator)
+        return operator
 
     def get_operator(self, operator_id: str) -> OperatorSession | None:
         """Get an operator by ID."""
@@ -171,27 +298,27 @@ class OperatorManager:
 
     def get_available_operators(self) -> list[OperatorSession]:
         """Get all available operators."""
-        return [op for op in self._operators.values() if op.is_available()]
+        return list(self._by_status[OperatorStatus.AVAILABLE].values())
 
     @property
     def available_count(self) -> int:
         """Count of available operators."""
-        return len(self.get_available_operators())
+        return len(self._by_status[OperatorStatus.AVAILABLE])
 
     @property
     def on_call_count(self) -> int:
         """Count of operators on calls."""
-        return len([op for op in self._operators.values() if op.status == OperatorStatus.ON_CALL])
+        return len(self._by_status[OperatorStatus.ON_CALL])
 
     @property
     def offline_count(self) -> int:
         """Count of offline operators."""
-        return len([op for op in self._operators.values() if op.status == OperatorStatus.OFFLINE])
+        return len(self._by_status[OperatorStatus.OFFLINE])
 
     @property
     def on_break_count(self) -> int:
         """Count of operators on break."""
-        return len([op for op in self._operators.values() if op.status == OperatorStatus.ON_BREAK])
+        return len(self._by_status[OperatorStatus.ON_BREAK])
 
     def select_operator(self) -> OperatorSession | None:
         """
@@ -202,13 +329,11 @@ class OperatorManager:
         Returns:
             The selected operator, or None if no one is available
         """
-        available = self.get_available_operators()
-        if not available:
-            return None
-
-        # Sort by idle time descending (longest first)
-        available.sort(key=lambda op: op.idle_duration_seconds, reverse=True)
-        return available[0]
+        # Longest idle = head of the idle ordering. Operators without an
+        # idle_since count as idle for 0 seconds, so they only come after it.
+        if self._idle_order:
+            return self._operators[self._idle_order[0][2]]
+        return next(iter(self._by_status[OperatorStatus.AVAILABLE].values()), None)
 
     def assign_call(
         self,
@@ -258,12 +383,10 @@ class OperatorManager:
         Returns:
             List of operators exceeding max idle time
         """
-        long_idle = []
-        for operator in self._operators.values():
-            if operator.status == OperatorStatus.AVAILABLE:
-                if operator.idle_duration_seconds > self.max_idle_seconds:
-                    long_idle.append(operator)
-        return long_idle
+        cutoff = datetime.now(UTC) - timedelta(seconds=self.max_idle_seconds)
+        # Entries idle since before the cutoff form a prefix of the ordering
+        end = bisect.bisect_left(self._idle_order, (cutoff,))
+        return [self._operators[operator_id] for _, _, operator_id in self._idle_order[:end]]
 
     def get_stats(self) -> dict[str, Any]:
         """Get overall operator statistics."""
@@ -279,7 +402,4 @@ class OperatorManager:
 
     def find_operator_by_call(self, call_sid: str) -> OperatorSession | None:
         """Find the operator handling a specific call."""
-        for operator in self._operators.values():
-            if operator.current_call_sid == call_sid:
-                return operator
-        return None
+        return self._by_call_sid.get(call_sid)
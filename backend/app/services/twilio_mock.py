@@ -1,9 +1,13 @@
 """Mock Twilio service for development and testing."""
 
 import asyncio
-import uuid
-from collections.abc import Callable
+import heapq
+import inspect
+import itertools
+import secrets
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from typing import Any
 
 from app.services.twilio_protocol import (
     AMDResult,
@@ -13,8 +17,33 @@ from app.services.twilio_protocol import (
     TwilioServiceProtocol,
 )
 
+# Seconds a mock call stays queued before it starts ringing
+QUEUED_TO_RINGING_DELAY = 0.5
 
-@dataclass
+# Status / AMD callbacks may be plain functions or coroutine functions
+StatusCallback = Callable[[str, CallStatus], None | Awaitable[None]]
+AMDCallback = Callable[[str, AMDResult], None | Awaitable[None]]
+
+
+def _run_sync_callbacks(callbacks: tuple[Callable[..., None], ...], *args: Any) -> None:
+    """
+    Call each callback in turn, skipping past any that raise.
+
+    The try block wraps the loop rather than each call; after a failure the
+    loop resumes from the next callback.
+    """
+    index = 0
+    count = len(callbacks)
+    while index < count:
+        try:
+            while index < count:
+                callbacks[index](*args)
+                index += 1
+        except Exception:
+            index += 1
+
+
+@dataclass(slots=True)
 class MockCall:
     """Internal representation of a mock call."""
 
@@ -24,9 +53,10 @@ class MockCall:
     status: CallStatus = CallStatus.QUEUED
     amd_result: AMDResult | None = None
     conference_sid: str | None = None
+    machine_detection: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class MockConference:
     """Internal representation of a mock conference."""
 
@@ -65,13 +95,26 @@ class MockTwilioService(TwilioServiceProtocol):
         self._calls: dict[str, MockCall] = {}
         self._conferences: dict[str, MockConference] = {}
 
-        # Callbacks for status changes (for webhook simulation)
-        self._status_callbacks: list[Callable[[str, CallStatus], None]] = []
-        self._amd_callbacks: list[Callable[[str, AMDResult], None]] = []
+        # Callbacks for status changes (for webhook simulation), split into sync
+        # and async at registration so notification needs no per-call dispatch
+        self._status_callbacks: tuple[Callable[[str, CallStatus], None], ...] = ()
+        self._async_status_callbacks: tuple[Callable[[str, CallStatus], Awaitable[None]], ...] = ()
+        self._amd_callbacks: tuple[Callable[[str, AMDResult], None], ...] = ()
+        self._async_amd_callbacks: tuple[Callable[[str, AMDResult], Awaitable[None]], ...] = ()
+
+        # Timer wheel for simulated call progression: one runner task works through
+        # a heap of (due_time, seq, call_sid) entries instead of one task per call
+        self._wheel: list[tuple[float, int, str]] = []
+        self._wheel_seq = itertools.count()
+        self._wheel_task: asyncio.Task[None] | None = None
+        self._wheel_changed = asyncio.Event()
+        # Due advances run as their own tasks so a slow callback for one call
+        # doesn't hold up the others; strong references keep them alive
+        self._advancing: set[asyncio.Task[None]] = set()
 
     def _generate_sid(self, prefix: str) -> str:
         """Generate a Twilio-like SID."""
-        return f"{prefix}{uuid.uuid4().hex[:32]}"
+        return f"{prefix}{secrets.token_hex(16)}"
 
     async def make_call(
         self,
@@ -88,11 +131,12 @@ class MockTwilioService(TwilioServiceProtocol):
             to=to,
             from_=from_,
             status=CallStatus.QUEUED,
+            machine_detection=machine_detection,
         )
         self._calls[call_sid] = mock_call
 
         # Simulate async call progression
-        asyncio.create_task(self._simulate_call_progression(call_sid, machine_detection))
+        self._schedule(call_sid, QUEUED_TO_RINGING_DELAY)
 
         return CallResult(
             call_sid=call_sid,
@@ -101,43 +145,77 @@ class MockTwilioService(TwilioServiceProtocol):
             from_=from_,
         )
 
-    async def _simulate_call_progression(self, call_sid: str, machine_detection: bool) -> None:
-        """Simulate the progression of a call through various states."""
+    def _schedule(self, call_sid: str, delay: float) -> None:
+        """Schedule the next progression step of a call, starting the runner if needed."""
+        loop = asyncio.get_running_loop()
+        task = self._wheel_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            # No runner is waiting on the old event, which may belong to another loop
+            self._wheel_changed = asyncio.Event()
+            self._wheel_task = loop.create_task(self._run_wheel())
+
+        entry = (loop.time() + delay, next(self._wheel_seq), call_sid)
+        heapq.heappush(self._wheel, entry)
+        if self._wheel[0] is entry:
+            self._wheel_changed.set()
+
+    async def _run_wheel(self) -> None:
+        """Advance scheduled calls as they come due, until nothing is scheduled."""
+        loop = asyncio.get_running_loop()
+        while self._wheel:
+            delay = self._wheel[0][0] - loop.time()
+            if delay > 0:
+                # Sleep until the head is due, or until an earlier entry is pushed
+                self._wheel_changed.clear()
+                try:
+                    await asyncio.wait_for(self._wheel_changed.wait(), delay)
+                except TimeoutError:
+                    pass
+                continue
+            _, _, call_sid = heapq.heappop(self._wheel)
+            task = loop.create_task(self._advance_call(call_sid))
+            self._advancing.add(task)
+            task.add_done_callback(self._advancing.discard)
+
+    async def _advance_call(self, call_sid: str) -> None:
+        """Move a call to its next simulated state and schedule the step after it."""
         call = self._calls.get(call_sid)
         if not call:
             return
 
-        # Queued -> Ringing
-        await asyncio.sleep(0.5)
-        call.status = CallStatus.RINGING
-        await self._notify_status_change(call_sid, CallStatus.RINGING)
-
-        # Ringing -> In Progress (answered)
-        await asyncio.sleep(self.call_answer_delay)
-        call.status = CallStatus.IN_PROGRESS
-        await self._notify_status_change(call_sid, CallStatus.IN_PROGRESS)
-
-        # AMD detection
-        if machine_detection:
-            await asyncio.sleep(self.amd_detection_delay)
+        if call.status == CallStatus.QUEUED:
+            # Queued -> Ringing
+            call.status = CallStatus.RINGING
+            await self._notify_status_change(call_sid, CallStatus.RINGING)
+            self._schedule(call_sid, self.call_answer_delay)
+        elif call.status == CallStatus.RINGING:
+            # Ringing -> In Progress (answered)
+            call.status = CallStatus.IN_PROGRESS
+            await self._notify_status_change(call_sid, CallStatus.IN_PROGRESS)
+            if call.machine_detection:
+                self._schedule(call_sid, self.amd_detection_delay)
+        elif call.status == CallStatus.IN_PROGRESS and call.amd_result is None:
+            # AMD detection
             call.amd_result = self.default_amd_result
             await self._notify_amd_result(call_sid, call.amd_result)
 
     async def _notify_status_change(self, call_sid: str, status: CallStatus) -> None:
         """Notify registered callbacks of status change."""
-        for callback in self._status_callbacks:
-            try:
-                callback(call_sid, status)
-            except Exception:
-                pass
+        _run_sync_callbacks(self._status_callbacks, call_sid, status)
+        if self._async_status_callbacks:
+            await asyncio.gather(
+                *(callback(call_sid, status) for callback in self._async_status_callbacks),
+                return_exceptions=True,
+            )
 
     async def _notify_amd_result(self, call_sid: str, result: AMDResult) -> None:
         """Notify registered callbacks of AMD result."""
-        for callback in self._amd_callbacks:
-            try:
-                callback(call_sid, result)
-            except Exception:
-                pass
+        _run_sync_callbacks(self._amd_callbacks, call_sid, result)
+        if self._async_amd_callbacks:
+            await asyncio.gather(
+                *(callback(call_sid, result) for callback in self._async_amd_callbacks),
+                return_exceptions=True,
+            )
 
     async def create_conference(self, friendly_name: str) -> Conference:
         """Create a mock conference."""
@@ -194,13 +272,19 @@ class MockTwilioService(TwilioServiceProtocol):
 
     # Test helper methods
 
-    def register_status_callback(self, callback: Callable[[str, CallStatus], None]) -> None:
-        """Register a callback for call status changes."""
-        self._status_callbacks.append(callback)
+    def register_status_callback(self, callback: StatusCallback) -> None:
+        """Register a callback (sync or async) for call status changes."""
+        if inspect.iscoroutinefunction(callback):
+            self._async_status_callbacks = (*self._async_status_callbacks, callback)
+        else:
+            self._status_callbacks = (*self._status_callbacks, callback)
 
-    def register_amd_callback(self, callback: Callable[[str, AMDResult], None]) -> None:
-        """Register a callback for AMD results."""
-        self._amd_callbacks.append(callback)
+    def register_amd_callback(self, callback: AMDCallback) -> None:
+        """Register a callback (sync or async) for AMD results."""
+        if inspect.iscoroutinefunction(callback):
+            self._async_amd_callbacks = (*self._async_amd_callbacks, callback)
+        else:
+            self._amd_callbacks = (*self._amd_callbacks, callback)
 
     def set_next_call_outcome(
         self,
@@ -223,3 +307,4 @@ class MockTwilioService(TwilioServiceProtocol):
         """Reset all mock data (for testing)."""
         self._calls.clear()
         self._conferences.clear()
+        self._wheel.clear()
@@ -30,7 +30,7 @@ class AMDResult(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class CallResult:
     """Result of a call initiation."""
 
@@ -40,7 +40,7 @@ class CallResult:
     from_: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Conference:
     """Conference room info."""
 
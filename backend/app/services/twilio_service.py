@@ -1,7 +1,11 @@
 """Real Twilio service implementation."""
 
+import asyncio
+from functools import lru_cache
 from typing import Any
 
+from requests.adapters import HTTPAdapter
+from twilio.http.http_client import TwilioHttpClient
 from twilio.rest import Client
 
 from app.config import get_settings
@@ -12,6 +16,25 @@ from app.services.twilio_protocol import (
     TwilioServiceProtocol,
 )
 
+# Shared by every call; the SDK only serializes lists (a tuple would be sent as
+# its repr), and it does not mutate the value
+_STATUS_CALLBACK_EVENTS = ["initiated", "ringing", "answered", "completed"]
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> Client:
+    """
+    Shared Twilio client, so all service instances reuse one connection pool.
+
+    Requests run on the default executor, so the keep-alive pool is sized to its
+    thread count; the SDK default (cpu_count + 4) would discard connections
+    beyond that and pay a new TLS handshake for them.
+    """
+    settings = get_settings()
+    http_client = TwilioHttpClient()
+    http_client.session.mount("https://", HTTPAdapter(pool_maxsize=settings.thread_pool_size))
+    return Client(settings.twilio_account_sid, settings.twilio_auth_token, http_client=http_client)
+
 
 class TwilioService(TwilioServiceProtocol):
     """
@@ -23,9 +46,18 @@ class TwilioService(TwilioServiceProtocol):
     def __init__(self) -> None:
         """Initialize with Twilio credentials from settings."""
         settings = get_settings()
-        self._client = Client(settings.twilio_account_sid, settings.twilio_auth_token)
+        self._client = _get_client()
         self._from_number = settings.twilio_phone_number
 
+        # Parameters that are the same for every call, merged into each request
+        self._base_params: dict[str, Any] = {
+            "url": "http://demo.twilio.com/docs/voice.xml",  # TwiML instructions
+        }
+        self._amd_params: dict[str, Any] = {
+            "machine_detection": "DetectMessageEnd",
+            "async_amd": True,
+        }
+
     async def make_call(
         self,
         to: str,
@@ -34,27 +66,25 @@ class TwilioService(TwilioServiceProtocol):
         machine_detection: bool = True,
     ) -> CallResult:
         """Initiate an outbound call via Twilio."""
-        call_params: dict[str, Any] = {
-            "to": to,
-            "from_": from_ or self._from_number,
-            "url": "http://demo.twilio.com/docs/voice.xml",  # TwiML instructions
-        }
+        from_ = from_ or self._from_number
+        call_params = {**self._base_params, "to": to, "from_": from_}
 
         if status_callback_url:
             call_params["status_callback"] = status_callback_url
-            call_params["status_callback_event"] = ["initiated", "ringing", "answered", "completed"]
+            call_params["status_callback_event"] = _STATUS_CALLBACK_EVENTS
 
         if machine_detection:
-            call_params["machine_detection"] = "DetectMessageEnd"
-            call_params["async_amd"] = True
+            call_params.update(self._amd_params)
 
-        call = self._client.calls.create(**call_params)
+        # The SDK client is blocking; run it on the default executor so the event
+        # loop keeps serving other calls and webhooks during the HTTP round trip
+        call = await asyncio.to_thread(self._client.calls.create, **call_params)
 
         return CallResult(
             call_sid=call.sid,
             status=CallStatus(call.status),
             to=to,
-            from_=from_ or self._from_number,
+            from_=from_,
         )
 
     async def create_conference(self, friendly_name: str) -> Conference:
@@ -81,9 +111,9 @@ class TwilioService(TwilioServiceProtocol):
 
     async def hangup_call(self, call_sid: str) -> None:
         """Hang up a call via Twilio."""
-        self._client.calls(call_sid).update(status="completed")
+        await asyncio.to_thread(self._client.calls(call_sid).update, status="completed")
 
     async def get_call_status(self, call_sid: str) -> CallStatus:
         """Get call status from Twilio."""
-        call = self._client.calls(call_sid).fetch()
+        call = await asyncio.to_thread(self._client.calls(call_sid).fetch)
         return CallStatus(call.status)
@@ -1,13 +1,18 @@
 """WebSocket connection manager."""
 
-import json
+import asyncio
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
+import orjson
 from fastapi import WebSocket
 
+# Messages a connection may have queued before it is treated as stalled and dropped
+OUTBOX_SIZE = 256
+
 
 class EventType(str, Enum):
     """WebSocket event types."""
@@ -30,6 +35,10 @@ class EventType(str, Enum):
     PONG = "pong"
 
 
+# Heartbeat reply, identical every time; clients only use it as a liveness signal
+PONG_FRAME = orjson.dumps({"event": EventType.PONG.value, "data": {}}).decode()
+
+
 @dataclass
 class WebSocketMessage:
     """WebSocket message structure."""
@@ -40,13 +49,15 @@ class WebSocketMessage:
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(
+        # orjson encodes the aware datetime natively, in the same ISO 8601 form
+        # as isoformat(); decoded to str because clients expect text frames
+        return orjson.dumps(
             {
                 "event": self.event.value,
                 "data": self.data,
-                "timestamp": self.timestamp.isoformat(),
+                "timestamp": self.timestamp,
             }
-        )
+        ).decode()
 
 
 @dataclass
@@ -59,6 +70,12 @@ class Connection:
     connected_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    # Serialized messages waiting for the writer task, which sends them in order
+    outbox: asyncio.Queue[str] = field(
+        default_factory=lambda: asyncio.Queue(maxsize=OUTBOX_SIZE), repr=False
+    )
+    writer_task: asyncio.Task[None] | None = field(default=None, repr=False)
+
 
 class ConnectionManager:
     """
@@ -74,19 +91,18 @@ class ConnectionManager:
         # All active connections
         self._connections: dict[str, Connection] = {}
 
-        # Grouped connections
-        self._operator_connections: dict[str, Connection] = {}
-        self._dashboard_connections: dict[str, Connection] = {}
+        # User IDs per connection type
+        self._by_type: dict[str, set[str]] = {"operator": set(), "dashboard": set()}
 
     @property
     def operator_count(self) -> int:
         """Number of connected operators."""
-        return len(self._operator_connections)
+        return len(self._by_type["operator"])
 
     @property
     def dashboard_count(self) -> int:
         """Number of connected dashboards."""
-        return len(self._dashboard_connections)
+        return len(self._by_type["dashboard"])
 
     async def connect(
         self,
@@ -116,13 +132,21 @@ class ConnectionManager:
             metadata=metadata or {},
         )
 
-        # Store connection
+        # Replace any previous connection of this user. The new connection is
+        # registered before the old socket is closed, so the old handler's
+        # cleanup finds it already superseded and leaves it alone.
+        previous = self._connections.get(user_id)
         self._connections[user_id] = connection
+        connection.writer_task = asyncio.create_task(self._writer_loop(connection))
+
+        if previous is not None:
+            self._discard_from_group(previous)
+        group = self._by_type.get(connection_type)
+        if group is not None:
+            group.add(user_id)
 
-        if connection_type == "operator":
-            self._operator_connections[user_id] = connection
-        elif connection_type == "dashboard":
-            self._dashboard_connections[user_id] = connection
+        if previous is not None:
+            await self._close(previous)
 
         # Send connected confirmation
         await self.send_to_user(
@@ -135,22 +159,42 @@ class ConnectionManager:
 
         return connection
 
-    async def disconnect(self, user_id: str) -> None:
+    async def disconnect(self, user_id: str, connection: Connection | None = None) -> bool:
         """
         Remove a WebSocket connection.
 
         Args:
             user_id: The user to disconnect
+            connection: Only disconnect if this is still the user's connection;
+                a handler passes its own so it can't close a newer reconnect
+
+        Returns:
+            True if a connection was removed
         """
-        connection = self._connections.pop(user_id, None)
-        if connection:
-            self._operator_connections.pop(user_id, None)
-            self._dashboard_connections.pop(user_id, None)
+        current = self._connections.get(user_id)
+        if current is None or (connection is not None and current is not connection):
+            return False
 
-            try:
-                await connection.websocket.close()
-            except Exception:
-                pass  # Connection might already be closed
+        del self._connections[user_id]
+        self._discard_from_group(current)
+        await self._close(current)
+        return True
+
+    def _discard_from_group(self, connection: Connection) -> None:
+        group = self._by_type.get(connection.connection_type)
+        if group is not None:
+            group.discard(connection.user_id)
+
+    async def _close(self, connection: Connection) -> None:
+        """Stop a connection's writer task and close its socket."""
+        task = connection.writer_task
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+        try:
+            await connection.websocket.close()
+        except Exception:
+            pass  # Connection might already be closed
 
     async def send_to_user(self, user_id: str, message: WebSocketMessage) -> bool:
         """
@@ -167,37 +211,90 @@ class ConnectionManager:
         if not connection:
             return False
 
+        return await self.send_frame(connection, message.to_json())
+
+    async def send_frame(self, connection: Connection, payload: str) -> bool:
+        """
+        Queue an already serialized frame on one connection.
+
+        Handlers reply through this rather than writing to the socket, so the
+        writer task stays the socket's only writer and replies are ordered with
+        broadcasts.
+
+        Returns:
+            True if queued
+        """
         try:
-            await connection.websocket.send_text(message.to_json())
+            connection.outbox.put_nowait(payload)
             return True
-        except Exception:
-            # Connection is broken, remove it
-            await self.disconnect(user_id)
+        except asyncio.QueueFull:
+            # Client is not keeping up, drop it
+            await self.disconnect(connection.user_id, connection)
             return False
 
-    async def broadcast_to_operators(self, message: WebSocketMessage) -> int:
+    async def _writer_loop(self, connection: Connection) -> None:
         """
-        Broadcast a message to all connected operators.
+        Send a connection's queued messages in order until it fails or is disconnected.
+
+        Clients that connected with ``supports_batch`` metadata get everything
+        queued at once coalesced into a single JSON-array frame.
+        """
+        outbox = connection.outbox
+        supports_batch = bool(connection.metadata.get("supports_batch"))
+        try:
+            while True:
+                payload = await outbox.get()
+                if supports_batch and not outbox.empty():
+                    batch = [payload]
+                    while not outbox.empty():
+                        batch.append(outbox.get_nowait())
+                    payload = "[" + ",".join(batch) + "]"
+                await connection.websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Connection is broken, remove it (unless the user has since reconnected)
+            await self.disconnect(connection.user_id, connection)
+
+    async def _broadcast(self, user_ids: Iterable[str], message: WebSocketMessage) -> int:
+        """
+        Queue a message for a group of connections.
+
+        Each connection's writer task does the actual send, so a slow client
+        never holds up the broadcaster or the other recipients. Connections
+        whose outbox is full are disconnected.
 
         Returns:
-            Number of operators that received the message
+            Number of connections the message was queued for
         """
+        payload = message.to_json()  # Serialize once, not per recipient
         sent_count = 0
-        failed_users = []
+        failed: list[Connection] = []
 
-        for user_id, connection in self._operator_connections.items():
+        connections = self._connections
+        for user_id in user_ids:
+            connection = connections[user_id]
             try:
-                await connection.websocket.send_text(message.to_json())
+                connection.outbox.put_nowait(payload)
                 sent_count += 1
-            except Exception:
-                failed_users.append(user_id)
+            except asyncio.QueueFull:
+                failed.append(connection)
 
-        # Clean up failed connections
-        for user_id in failed_users:
-            await self.disconnect(user_id)
+        # Clean up stalled connections
+        for connection in failed:
+            await self.disconnect(connection.user_id, connection)
 
         return sent_count
 
+    async def broadcast_to_operators(self, message: WebSocketMessage) -> int:
+        """
+        Broadcast a message to all connected operators.
+
+        Returns:
+            Number of operators that received the message
+        """
+        return await self._broadcast(self._by_type["operator"], message)
+
     async def broadcast_to_dashboards(self, message: WebSocketMessage) -> int:
         """
         Broadcast a message to all connected dashboards.
@@ -205,21 +302,7 @@ class ConnectionManager:
         Returns:
             Number of dashboards that received the message
         """
-        sent_count = 0
-        failed_users = []
-
-        for user_id, connection in self._dashboard_connections.items():
-            try:
-                await connection.websocket.send_text(message.to_json())
-                sent_count += 1
-            except Exception:
-                failed_users.append(user_id)
-
-        # Clean up failed connections
-        for user_id in failed_users:
-            await self.disconnect(user_id)
-
-        return sent_count
+        return await self._broadcast(self._by_type["dashboard"], message)
 
     async def broadcast_to_all(self, message: WebSocketMessage) -> int:
         """
@@ -228,21 +311,7 @@ class ConnectionManager:
         Returns:
             Number of clients that received the message
         """
-        sent_count = 0
-        failed_users = []
-
-        for user_id, connection in self._connections.items():
-            try:
-                await connection.websocket.send_text(message.to_json())
-                sent_count += 1
-            except Exception:
-                failed_users.append(user_id)
-
-        # Clean up failed connections
-        for user_id in failed_users:
-            await self.disconnect(user_id)
-
-        return sent_count
+        return await self._broadcast(self._connections, message)
 
     def get_connection(self, user_id: str) -> Connection | None:
         """Get a connection by user ID."""
@@ -250,11 +319,11 @@ class ConnectionManager:
 
     def get_all_operator_ids(self) -> list[str]:
         """Get all connected operator user IDs."""
-        return list(self._operator_connections.keys())
+        return list(self._by_type["operator"])
 
     def get_all_dashboard_ids(self) -> list[str]:
         """Get all connected dashboard user IDs."""
-        return list(self._dashboard_connections.keys())
+        return list(self._by_type["dashboard"])
 
 
 # Global connection manager instance
@@ -1,17 +1,21 @@
 """Dashboard WebSocket handler."""
 
-import json
+import asyncio
+from datetime import UTC, datetime
 from typing import Annotated, Any
 
+import orjson
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
-from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import CampaignDB, LeadDB
+from app.db.models import CAMPAIGN_STATS_STMT
 from app.db.session import get_session
 from app.models.lead import LeadStatus
 from app.services.auth_service import get_user, verify_access_token
 from app.websocket.connection_manager import (
+    PONG_FRAME,
+    Connection,
     EventType,
     WebSocketMessage,
     manager,
@@ -20,6 +24,13 @@ from app.websocket.operator_ws import operator_sessions
 
 router = APIRouter()
 
+# How long (seconds) computed campaign stats are served to dashboards before re-querying
+STATS_CACHE_TTL = 1.0
+# Campaigns (including unknown ids) whose stats are cached at once
+STATS_CACHE_SIZE = 1000
+
+_MISSING = object()
+
 
 async def authenticate_websocket(token: str | None) -> dict[str, Any] | None:
     """Authenticate WebSocket connection using JWT token."""
@@ -37,72 +48,109 @@ async def authenticate_websocket(token: str | None) -> dict[str, Any] | None:
     return get_user(username)
 
 
-async def get_campaign_stats(
+async def _query_campaign_stats(
     session: AsyncSession,
     campaign_id: str,
 ) -> dict[str, Any] | None:
-    """Get campaign statistics."""
-    campaign = await session.get(CampaignDB, campaign_id)
-    if not campaign:
+    result = await session.execute(CAMPAIGN_STATS_STMT, {"campaign_id": campaign_id})
+    row = result.first()
+    if not row:
         return None
-
-    stmt = (
-        select(LeadDB.status, func.count(LeadDB.id))
-        .where(LeadDB.campaign_id == campaign_id)
-        .group_by(LeadDB.status)
-    )
-    result = await session.execute(stmt)
-
-    pending = calling = connected = completed = failed = dnc = 0
-    total = 0
-
-    for status_value, count in result.all():
-        count = int(count)
-        total += count
-        status = status_value if isinstance(status_value, LeadStatus) else LeadStatus(status_value)
-        if status == LeadStatus.PENDING:
-            pending += count
-        elif status == LeadStatus.CALLING:
-            calling += count
-        elif status == LeadStatus.CONNECTED:
-            connected += count
-        elif status == LeadStatus.COMPLETED:
-            completed += count
-        elif status == LeadStatus.FAILED:
-            failed += count
-        elif status == LeadStatus.DNC:
-            dnc += count
+    counts = row._mapping
 
     abandon_rate = 0.0
 
     return {
         "campaign_id": campaign_id,
-        "name": campaign.name,
-        "status": campaign.status.value if hasattr(campaign.status, "value") else str(campaign.status),
-        "total_leads": total,
-        "pending_leads": pending,
-        "calling_leads": calling,
-        "connected_leads": connected,
-        "completed_leads": completed,
-        "failed_leads": failed,
-        "dnc_leads": dnc,
+        "name": row.name,
+        "status": row.status.value if hasattr(row.status, "value") else str(row.status),
+        "total_leads": counts["total"],
+        "pending_leads": counts[LeadStatus.PENDING.value],
+        "calling_leads": counts[LeadStatus.CALLING.value],
+        "connected_leads": counts[LeadStatus.CONNECTED.value],
+        "completed_leads": counts[LeadStatus.COMPLETED.value],
+        "failed_leads": counts[LeadStatus.FAILED.value],
+        "dnc_leads": counts[LeadStatus.DNC.value],
         "abandon_rate": abandon_rate,
     }
 
 
+class StatsCache:
+    """
+    Short-lived per-campaign cache of dashboard stats.
+
+    Dashboards subscribing to or refreshing the same campaign within
+    STATS_CACHE_TTL share one aggregation query, and concurrent misses wait
+    for the query already in flight instead of each running it. Unknown
+    campaign ids are cached (as None) too, so probing bogus ids can't bypass
+    the cache; entries are bounded by STATS_CACHE_SIZE.
+    """
+
+    def __init__(self) -> None:
+        self._entries: TTLCache[str, dict[str, Any] | None] = TTLCache(
+            maxsize=STATS_CACHE_SIZE, ttl=STATS_CACHE_TTL
+        )
+        # Queries in flight, removed as soon as they finish
+        self._inflight: dict[str, asyncio.Future[dict[str, Any] | None]] = {}
+
+    async def get(self, session: AsyncSession, campaign_id: str) -> dict[str, Any] | None:
+        """Get campaign stats, querying only when there is no fresh cached entry."""
+        stats = self._entries.get(campaign_id, _MISSING)
+        if stats is not _MISSING:
+            return stats
+
+        pending = self._inflight.get(campaign_id)
+        if pending is not None:
+            try:
+                # Shielded: a waiter being cancelled must not cancel the shared query
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The query's owner was cancelled; run it here instead
+
+        pending = asyncio.get_running_loop().create_future()
+        self._inflight[campaign_id] = pending
+        try:
+            stats = await _query_campaign_stats(session, campaign_id)
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+        except Exception as e:
+            pending.set_exception(e)
+            pending.exception()  # Mark retrieved; waiters (if any) re-raise it
+            raise
+        finally:
+            if self._inflight.get(campaign_id) is pending:
+                del self._inflight[campaign_id]
+
+        self._entries[campaign_id] = stats
+        pending.set_result(stats)
+        return stats
+
+
+stats_cache = StatsCache()
+
+
+async def get_campaign_stats(
+    session: AsyncSession,
+    campaign_id: str,
+) -> dict[str, Any] | None:
+    """Get campaign statistics (cached for STATS_CACHE_TTL seconds)."""
+    return await stats_cache.get(session, campaign_id)
+
+
 def get_operators_list() -> list[dict[str, Any]]:
     """Get list of all operators and their statuses."""
-    operators = []
-    for op_id, session in operator_sessions.items():
-        operators.append({
-            "id": op_id,
-            "name": session.name,
-            "status": session.status.value,
-            "current_call_sid": session.current_call_sid,
-            "idle_duration_seconds": session.idle_duration_seconds,
-            "calls_handled": session.calls_handled,
-        })
-    return operators
+    now = datetime.now(UTC)  # One clock read for every operator's idle duration
+    # Only idle durations change between operator updates; the rest is pre-built
+    return [
+        {
+            **row,
+            "idle_duration_seconds": (now - idle_since).total_seconds() if idle_since else 0.0,
+        }
+        for row, idle_since in operator_sessions.listing_rows()
+    ]
 
 
 async def handle_dashboard_message(
@@ -118,10 +166,7 @@ async def handle_dashboard_message(
     """
     action = message.get("action")
 
-    if action == "ping":
-        return WebSocketMessage(event=EventType.PING, data={})
-
-    elif action == "subscribe_campaign":
+    if action == "subscribe_campaign":
         campaign_id = message.get("campaign_id")
         if not isinstance(campaign_id, str):
             return WebSocketMessage(
@@ -178,6 +223,7 @@ async def dashboard_websocket(
     websocket: WebSocket,
     session: Annotated[AsyncSession, Depends(get_session)],
     token: str | None = Query(None),
+    batch: bool = Query(False),
 ) -> None:
     """
     WebSocket endpoint for dashboard.
@@ -189,6 +235,7 @@ async def dashboard_websocket(
 
     Query params:
         token: JWT access token for authentication
+        batch: Client accepts JSON-array frames carrying several messages
     """
     # Authenticate
     user = await authenticate_websocket(token)
@@ -199,32 +246,37 @@ async def dashboard_websocket(
     user_id = f"dashboard-{user['id']}"
 
     # Connect
+    connection: Connection | None = None
     try:
-        await manager.connect(
+        connection = await manager.connect(
             websocket=websocket,
             user_id=user_id,
             connection_type="dashboard",
-            metadata={"username": user["username"], "role": user["role"]},
+            metadata={
+                "username": user["username"],
+                "role": user["role"],
+                "supports_batch": batch,
+            },
         )
 
         # Message loop
         while True:
             try:
                 data = await websocket.receive_text()
-                message = json.loads(data)
+                message = orjson.loads(data)
+
+                # Answer heartbeats straight away with the prebuilt frame
+                if message.get("action") == "ping":
+                    await manager.send_frame(connection, PONG_FRAME)
+                    continue
 
                 response = await handle_dashboard_message(user_id, message, websocket, session)
                 if response:
-                    # Handle ping specially
-                    if response.event == EventType.PING:
-                        await websocket.send_text(
-                            WebSocketMessage(event=EventType.PONG, data={}).to_json()
-                        )
-                    else:
-                        await websocket.send_text(response.to_json())
-
-            except json.JSONDecodeError:
-                await websocket.send_text(
+                    await manager.send_frame(connection, response.to_json())
+
+            except orjson.JSONDecodeError:
+                await manager.send_frame(
+                    connection,
                     WebSocketMessage(
                         event=EventType.ERROR,
                         data={"message": "Invalid JSON"},
@@ -234,4 +286,5 @@ async def dashboard_websocket(
     except WebSocketDisconnect:
         pass
     finally:
-        await manager.disconnect(user_id)
+        if connection is not None:
+            await manager.disconnect(user_id, connection)
@@ -1,13 +1,17 @@
 """Operator WebSocket handler."""
 
-import json
+from collections.abc import ItemsView
+from datetime import datetime
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 
 from app.services.auth_service import get_user, verify_access_token
-from app.services.operator_manager import OperatorSession
+from app.services.operator_manager import OperatorSession, OperatorStatus
 from app.websocket.connection_manager import (
+    PONG_FRAME,
+    Connection,
     EventType,
     WebSocketMessage,
     manager,
@@ -15,8 +19,76 @@ from app.websocket.connection_manager import (
 
 router = APIRouter()
 
+
+class OperatorSessionRegistry:
+    """
+    In-memory operator sessions keyed by user ID.
+
+    Keeps the dashboard operator listing pre-built between changes. The
+    registry subscribes to each session's change listeners, so any status
+    change or transition, wherever it is made, invalidates the listing.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: dict[str, OperatorSession] = {}
+        # (row without idle duration, idle_since) per operator; None when stale
+        self._rows: list[tuple[dict[str, Any], datetime | None]] | None = None
+
+    def get(self, user_id: str) -> OperatorSession | None:
+        return self._sessions.get(user_id)
+
+    def __contains__(self, user_id: object) -> bool:
+        return user_id in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __setitem__(self, user_id: str, session: OperatorSession) -> None:
+        previous = self._sessions.get(user_id)
+        if previous is not None:
+            previous._change_listeners.remove(self._on_session_change)
+        self._sessions[user_id] = session
+        session._change_listeners.append(self._on_session_change)
+        self._rows = None
+
+    def __delitem__(self, user_id: str) -> None:
+        session = self._sessions.pop(user_id)
+        session._change_listeners.remove(self._on_session_change)
+        self._rows = None
+
+    def items(self) -> ItemsView[str, OperatorSession]:
+        return self._sessions.items()
+
+    def _on_session_change(
+        self,
+        session: OperatorSession,
+        old_status: OperatorStatus,
+        old_call_sid: str | None,
+    ) -> None:
+        """Drop the pre-built listing after a session changes."""
+        self._rows = None
+
+    def listing_rows(self) -> list[tuple[dict[str, Any], datetime | None]]:
+        """Per-operator listing fields plus idle_since, rebuilt only after a change."""
+        if self._rows is None:
+            self._rows = [
+                (
+                    {
+                        "id": op_id,
+                        "name": session.name,
+                        "status": session.status.value,
+                        "current_call_sid": session.current_call_sid,
+                        "calls_handled": session.calls_handled,
+                    },
+                    session.idle_since,
+                )
+                for op_id, session in self._sessions.items()
+            ]
+        return self._rows
+
+
 # In-memory operator sessions (shared with operator_manager)
-operator_sessions: dict[str, OperatorSession] = {}
+operator_sessions = OperatorSessionRegistry()
 
 
 async def authenticate_websocket(token: str | None) -> dict[str, Any] | None:
@@ -47,10 +119,7 @@ async def handle_operator_message(
     """
     action = message.get("action")
 
-    if action == "ping":
-        return WebSocketMessage(event=EventType.PING, data={})
-
-    elif action == "set_status":
+    if action == "set_status":
         new_status = message.get("status")
         session = operator_sessions.get(user_id)
 
@@ -186,8 +255,9 @@ async def operator_websocket(
     user_id = user["id"]
 
     # Connect
+    connection: Connection | None = None
     try:
-        await manager.connect(
+        connection = await manager.connect(
             websocket=websocket,
             user_id=user_id,
             connection_type="operator",
@@ -205,20 +275,20 @@ async def operator_websocket(
         while True:
             try:
                 data = await websocket.receive_text()
-                message = json.loads(data)
+                message = orjson.loads(data)
+
+                # Answer heartbeats straight away with the prebuilt frame
+                if message.get("action") == "ping":
+                    await manager.send_frame(connection, PONG_FRAME)
+                    continue
 
                 response = await handle_operator_message(user_id, message, websocket)
                 if response:
-                    # Handle ping specially
-                    if response.event == EventType.PING:
-                        await websocket.send_text(
-                            WebSocketMessage(event=EventType.PONG, data={}).to_json()
-                        )
-                    else:
-                        await websocket.send_text(response.to_json())
-
-            except json.JSONDecodeError:
-                await websocket.send_text(
+                    await manager.send_frame(connection, response.to_json())
+
+            except orjson.JSONDecodeError:
+                await manager.send_frame(
+                    connection,
                     WebSocketMessage(
                         event=EventType.ERROR,
                         data={"message": "Invalid JSON"},
@@ -228,8 +298,9 @@ async def operator_websocket(
     except WebSocketDisconnect:
         pass
     finally:
-        await manager.disconnect(user_id)
-        # Mark operator as offline
+        if connection is not None:
+            await manager.disconnect(user_id, connection)
+        # Mark operator as offline, unless they have already reconnected on a new socket
         session = operator_sessions.get(user_id)
-        if session:
+        if session and manager.get_connection(user_id) is None:
             session.go_offline()
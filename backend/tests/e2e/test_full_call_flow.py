@@ -282,6 +282,9 @@ class TestFullCallFlowWithWebSocket:
             data = websocket.receive_json()
             assert data["event"] == "campaign_stats_updated"
             assert data["data"]["campaign_id"] == campaign_id
+            assert data["data"]["total_leads"] == 3
+            assert data["data"]["pending_leads"] == 3
+            assert data["data"]["completed_leads"] == 0
 
     def test_dashboard_get_operators(self, client: TestClient, auth_token: str):
         """ダッシュボードでオペレーター一覧を取得"""
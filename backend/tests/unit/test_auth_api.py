@@ -125,3 +125,52 @@ class TestProtectedEndpoint:
             headers={"Authorization": f"Bearer {expired_token}"},
         )
         assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_repeated_requests_reuse_verified_token(
+        self, client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """同じトークンの2回目以降は検証をスキップ"""
+        from app.api.v1 import auth
+
+        login_response = await client.post(
+            "/api/v1/auth/login",
+            data={"username": "operator1", "password": "operator123"},
+        )
+        access_token = login_response.json()["access_token"]
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        first = await client.get("/api/v1/auth/me", headers=headers)
+        assert first.status_code == 200
+
+        def fail_verify(token: str) -> None:
+            raise AssertionError("token should be served from cache")
+
+        monkeypatch.setattr(auth, "verify_access_token", fail_verify)
+        second = await client.get("/api/v1/auth/me", headers=headers)
+        assert second.status_code == 200
+        assert second.json()["username"] == "operator1"
+
+    @pytest.mark.asyncio
+    async def test_expired_token_rejected_before_verification(
+        self, client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """期限切れトークンは署名検証前に拒否"""
+        from datetime import timedelta
+
+        from app.api.v1 import auth
+        from app.services.auth_service import create_access_token
+
+        expired_token = create_access_token(
+            data={"sub": "operator1"}, expires_delta=timedelta(seconds=-10)
+        )
+
+        def fail_verify(token: str) -> None:
+            raise AssertionError("expired token should not reach verification")
+
+        monkeypatch.setattr(auth, "verify_access_token", fail_verify)
+        response = await client.get(
+            "/api/v1/auth/me",
+            headers={"Authorization": f"Bearer {expired_token}"},
+        )
+        assert response.status_code == 401
@@ -138,6 +138,50 @@ class TestListCampaigns:
         assert isinstance(data, list)
         assert len(data) >= 2
 
+    @pytest.mark.asyncio
+    async def test_list_campaigns_paginated(self, client: AsyncClient, auth_headers: dict):
+        """ページネーション付きで新しい順に一覧取得"""
+        older = await client.post(
+            "/api/v1/campaigns",
+            json={"name": "ページテスト古い"},
+            headers=auth_headers,
+        )
+        newer = await client.post(
+            "/api/v1/campaigns",
+            json={"name": "ページテスト新しい"},
+            headers=auth_headers,
+        )
+        await client.post(
+            f"/api/v1/campaigns/{newer.json()['id']}/leads",
+            json={"phone_number": "+818012121212"},
+            headers=auth_headers,
+        )
+
+        response = await client.get(
+            "/api/v1/campaigns",
+            params={"limit": 2},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [c["id"] for c in data] == [newer.json()["id"], older.json()["id"]]
+        assert data[0]["lead_count"] == 1
+        assert data[1]["lead_count"] == 0
+
+        response = await client.get(
+            "/api/v1/campaigns",
+            params={"skip": 1, "limit": 1},
+            headers=auth_headers,
+        )
+        assert [c["id"] for c in response.json()] == [older.json()["id"]]
+
+        response = await client.get(
+            "/api/v1/campaigns",
+            params={"limit": 0},
+            headers=auth_headers,
+        )
+        assert response.status_code == 422
+
 
 class TestCampaignActions:
     """Tests for campaign actions (start, pause, stop)."""
@@ -238,6 +282,40 @@ class TestCampaignActions:
         assert response.status_code == 200
         assert response.json()["status"] == "stopped"
 
+    @pytest.mark.asyncio
+    async def test_resume_paused_campaign(self, client: AsyncClient, auth_headers: dict):
+        """一時停止中のキャンペーンを再開"""
+        create_response = await client.post(
+            "/api/v1/campaigns",
+            json={"name": "再開テスト"},
+            headers=auth_headers,
+        )
+        campaign_id = create_response.json()["id"]
+
+        await client.post(
+            f"/api/v1/campaigns/{campaign_id}/leads",
+            json={"phone_number": "+818077778888"},
+            headers=auth_headers,
+        )
+        await client.post(f"/api/v1/campaigns/{campaign_id}/start", headers=auth_headers)
+        await client.post(f"/api/v1/campaigns/{campaign_id}/pause", headers=auth_headers)
+
+        # 再開
+        response = await client.post(
+            f"/api/v1/campaigns/{campaign_id}/resume",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["status"] == "running"
+        assert response.json()["lead_count"] == 1
+
+        # 再開済みのキャンペーンは再度再開できない
+        response = await client.post(
+            f"/api/v1/campaigns/{campaign_id}/resume",
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
 
 class TestCampaignStats:
     """Tests for campaign statistics."""
@@ -270,6 +348,34 @@ class TestCampaignStats:
         assert "total_leads" in data
         assert "pending_leads" in data
         assert data["total_leads"] == 1
+        assert data["pending_leads"] == 1
+        assert data["calling_leads"] == 0
+
+    @pytest.mark.asyncio
+    async def test_get_stats_for_empty_and_missing_campaign(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """リードなし・存在しないキャンペーンの統計"""
+        create_response = await client.post(
+            "/api/v1/campaigns",
+            json={"name": "空の統計テスト"},
+            headers=auth_headers,
+        )
+        campaign_id = create_response.json()["id"]
+
+        response = await client.get(
+            f"/api/v1/campaigns/{campaign_id}/stats",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["total_leads"] == 0
+        assert response.json()["pending_leads"] == 0
+
+        response = await client.get(
+            "/api/v1/campaigns/nonexistent-id/stats",
+            headers=auth_headers,
+        )
+        assert response.status_code == 404
 
 
 class TestAddLead:
@@ -337,3 +443,122 @@ class TestAddLead:
             headers=auth_headers,
         )
         assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_add_lead_fullwidth_digits_rejected(self, client: AsyncClient, auth_headers: dict):
+        """全角数字を含む電話番号はバリデーションで拒否される"""
+        create_response = await client.post(
+            "/api/v1/campaigns",
+            json={"name": "全角電話テスト"},
+            headers=auth_headers,
+        )
+        campaign_id = create_response.json()["id"]
+
+        response = await client.post(
+            f"/api/v1/campaigns/{campaign_id}/leads",
+            json={"phone_number": "+8１９０１２３４５６７"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_add_lead_to_missing_or_stopped_campaign(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """存在しない/停止済みキャンペーンへのリード追加は失敗"""
+        response = await client.post(
+            "/api/v1/campaigns/nonexistent-id/leads",
+            json={"phone_number": "+818011112222"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 404
+
+        create_response = await client.post(
+            "/api/v1/campaigns",
+            json={"name": "停止後追加テスト"},
+            headers=auth_headers,
+        )
+        campaign_id = create_response.json()["id"]
+        await client.post(
+            f"/api/v1/campaigns/{campaign_id}/leads",
+            json={"phone_number": "+818011112222"},
+            headers=auth_headers,
+        )
+        await client.post(f"/api/v1/campaigns/{campaign_id}/start", headers=auth_headers)
+        await client.post(f"/api/v1/campaigns/{campaign_id}/stop", headers=auth_headers)
+
+        response = await client.post(
+            f"/api/v1/campaigns/{campaign_id}/leads",
+            json={"phone_number": "+818033334444"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+        assert "stopped" in response.json()["detail"]
+
+
+class TestListLeads:
+    """Tests for listing leads."""
+
+    @pytest.mark.asyncio
+    async def test_list_leads_paginated(self, client: AsyncClient, auth_headers: dict):
+        """リード一覧をページ単位で取得"""
+        create_response = await client.post(
+            "/api/v1/campaigns",
+            json={"name": "リード一覧テスト"},
+            headers=auth_headers,
+        )
+        campaign_id = create_response.json()["id"]
+
+        phones = ["+818020000001", "+818020000002", "+818020000003"]
+        for phone in phones:
+            await client.post(
+                f"/api/v1/campaigns/{campaign_id}/leads",
+                json={"phone_number": phone},
+                headers=auth_headers,
+            )
+
+        response = await client.get(
+            f"/api/v1/campaigns/{campaign_id}/leads",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert [lead["phone_number"] for lead in response.json()] == phones
+
+        response = await client.get(
+            f"/api/v1/campaigns/{campaign_id}/leads",
+            params={"skip": 1, "limit": 1},
+            headers=auth_headers,
+        )
+        assert [lead["phone_number"] for lead in response.json()] == phones[1:2]
+
+        response = await client.get(
+            f"/api/v1/campaigns/{campaign_id}/leads",
+            params={"limit": 1001},
+            headers=auth_headers,
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_list_leads_empty_and_missing_campaign(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """リードなしは空リスト、存在しないキャンペーンは404"""
+        create_response = await client.post(
+            "/api/v1/campaigns",
+            json={"name": "空のリード一覧テスト"},
+            headers=auth_headers,
+        )
+        campaign_id = create_response.json()["id"]
+
+        response = await client.get(
+            f"/api/v1/campaigns/{campaign_id}/leads",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json() == []
+
+        response = await client.get(
+            "/api/v1/campaigns/nonexistent-id/leads",
+            headers=auth_headers,
+        )
+        assert response.status_code == 404
@@ -140,6 +140,34 @@ class TestCampaignLeadManagement:
         with pytest.raises(ValueError):
             campaign.add_lead(Lead(phone_number="+818011112222"))
 
+    def test_add_leads_skips_duplicates(self):
+        """一括追加は重複をスキップしてエラーに記録"""
+        campaign = Campaign(name="テスト")
+        campaign.add_lead(Lead(phone_number="+818011112222"))
+
+        added, errors = campaign.add_leads(
+            [
+                Lead(phone_number="+818011112222"),
+                Lead(phone_number="+818033334444"),
+                Lead(phone_number="+818033334444"),
+            ]
+        )
+
+        assert added == 1
+        assert [e["phone"] for e in errors] == ["+818011112222", "+818033334444"]
+        assert len(campaign.leads) == 2
+        assert campaign.leads[1].campaign_id == campaign.id
+
+    def test_cannot_add_leads_to_stopped_campaign(self):
+        """停止済みキャンペーンには一括追加できない"""
+        campaign = Campaign(name="テスト")
+        campaign.add_lead(Lead(phone_number="+818011112222"))
+        campaign.start()
+        campaign.stop()
+
+        with pytest.raises(InvalidCampaignStateError):
+            campaign.add_leads([Lead(phone_number="+818033334444")])
+
     def test_get_next_lead_returns_pending_lead(self):
         """get_next_leadはPENDINGのリードを返す"""
         campaign = Campaign(name="テスト")
@@ -165,6 +193,44 @@ class TestCampaignLeadManagement:
         next_lead = campaign.get_next_lead()
         assert next_lead is None
 
+    def test_callable_leads_follow_status_changes(self):
+        """発信対象はリードのステータス変化に追従し、リトライは末尾に戻る"""
+        campaign = Campaign(name="テスト")
+        lead1 = Lead(phone_number="+818011111111")
+        lead2 = Lead(phone_number="+818022222222")
+        lead3 = Lead(phone_number="+818033333333")
+        for lead in (lead1, lead2, lead3):
+            campaign.add_lead(lead)
+        campaign.start()
+
+        lead1.start_calling()
+        assert campaign.get_callable_leads(10) == [lead2, lead3]
+
+        lead1.fail(reason="busy")
+        lead1.retry()
+        assert campaign.get_callable_leads(10) == [lead2, lead3, lead1]
+        assert campaign.get_callable_leads(2) == [lead2, lead3]
+
+    def test_removed_lead_is_no_longer_tracked(self):
+        """削除したリードは統計・発信対象から外れる"""
+        campaign = Campaign(name="テスト")
+        lead1 = Lead(phone_number="+818011111111")
+        lead2 = Lead(phone_number="+818022222222")
+        campaign.add_lead(lead1)
+        campaign.add_lead(lead2)
+
+        assert campaign.remove_lead(lead1.id) is lead1
+        assert campaign.remove_lead("missing") is None
+        assert campaign.leads == [lead2]
+        lead1.mark_dnc()
+
+        stats = campaign.get_stats()
+        assert stats.total_leads == 1
+        assert stats.pending_leads == 1
+        assert stats.dnc_leads == 0
+        campaign.start()
+        assert campaign.get_next_lead() is lead2
+
 
 class TestCampaignStats:
     """Tests for Campaign statistics."""
@@ -0,0 +1,191 @@
+"""Unit tests for ConnectionManager."""
+
+import asyncio
+import json
+
+import pytest
+
+from app.websocket import connection_manager
+from app.websocket.connection_manager import (
+    ConnectionManager,
+    EventType,
+    WebSocketMessage,
+)
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a Starlette WebSocket."""
+
+    def __init__(self, fail: bool = False, delay: float = 0.0):
+        self.fail = fail
+        self.delay = delay
+        self.sent: list[str] = []
+        self.closed = False
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("send failed")
+        self.sent.append(data)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+async def _drain() -> None:
+    """Let the connections' writer tasks send what is queued."""
+    await asyncio.sleep(0.01)
+
+
+async def _connect(manager: ConnectionManager, user_id: str, connection_type: str, **kwargs) -> FakeWebSocket:
+    websocket = FakeWebSocket()
+    await manager.connect(
+        websocket=websocket,  # type: ignore[arg-type]
+        user_id=user_id,
+        connection_type=connection_type,
+        metadata=kwargs.get("metadata"),
+    )
+    await _drain()
+    assert len(websocket.sent) == 1  # "connected" confirmation
+    websocket.sent.clear()
+    websocket.fail = kwargs.get("fail", False)
+    websocket.delay = kwargs.get("delay", 0.0)
+    return websocket
+
+
+class TestBroadcast:
+    """Tests for group broadcasts."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_only_target_group(self):
+        """ブロードキャストは対象グループだけに届く"""
+        manager = ConnectionManager()
+        op = await _connect(manager, "op1", "operator")
+        dash = await _connect(manager, "dash1", "dashboard")
+
+        sent = await manager.broadcast_to_dashboards(
+            WebSocketMessage(event=EventType.ALERT, data={"level": "warning"})
+        )
+        await _drain()
+
+        assert sent == 1
+        assert len(dash.sent) == 1
+        assert op.sent == []
+
+    @pytest.mark.asyncio
+    async def test_failed_send_disconnects_user(self):
+        """送信に失敗した接続は切断される"""
+        manager = ConnectionManager()
+        ok = await _connect(manager, "dash1", "dashboard")
+        broken = await _connect(manager, "dash2", "dashboard", fail=True)
+
+        await manager.broadcast_to_dashboards(WebSocketMessage(event=EventType.ALERT, data={}))
+        await _drain()
+
+        assert len(ok.sent) == 1
+        assert broken.closed is True
+        assert manager.dashboard_count == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_broadcast(self):
+        """遅いクライアントがいてもブロードキャストは待たされない"""
+        manager = ConnectionManager()
+        slow = await _connect(manager, "dash1", "dashboard", delay=10.0)
+        fast = await _connect(manager, "dash2", "dashboard")
+
+        sent = await asyncio.wait_for(
+            manager.broadcast_to_dashboards(WebSocketMessage(event=EventType.ALERT, data={})),
+            timeout=1.0,
+        )
+        await _drain()
+
+        assert sent == 2
+        assert len(fast.sent) == 1
+        assert slow.sent == []
+        await manager.disconnect("dash1")
+
+    @pytest.mark.asyncio
+    async def test_stalled_client_is_dropped_when_outbox_full(self, monkeypatch):
+        """送信待ちが上限を超えたクライアントは切断される"""
+        monkeypatch.setattr(connection_manager, "OUTBOX_SIZE", 2)
+        manager = ConnectionManager()
+        stalled = await _connect(manager, "dash1", "dashboard", delay=10.0)
+
+        for _ in range(4):
+            await manager.broadcast_to_dashboards(WebSocketMessage(event=EventType.ALERT, data={}))
+
+        assert stalled.closed is True
+        assert manager.dashboard_count == 0
+
+    @pytest.mark.asyncio
+    async def test_messages_keep_order_per_connection(self):
+        """同じ接続へのメッセージは順番通りに届く"""
+        manager = ConnectionManager()
+        dash = await _connect(manager, "dash1", "dashboard")
+
+        for i in range(5):
+            await manager.send_to_user("dash1", WebSocketMessage(event=EventType.ALERT, data={"i": i}))
+        await _drain()
+
+        assert [json.loads(payload)["data"]["i"] for payload in dash.sent] == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_queued_messages_are_coalesced_for_batch_clients(self):
+        """バッチ対応クライアントには溜まったメッセージが1フレームにまとめて届く"""
+        manager = ConnectionManager()
+        dash = await _connect(manager, "dash1", "dashboard", metadata={"supports_batch": True})
+
+        for i in range(3):
+            await manager.send_to_user("dash1", WebSocketMessage(event=EventType.ALERT, data={"i": i}))
+        await _drain()
+
+        assert len(dash.sent) == 1
+        assert [message["data"]["i"] for message in json.loads(dash.sent[0])] == [0, 1, 2]
+
+
+class TestReconnect:
+    """Tests for a user reconnecting while the old connection's handler still runs."""
+
+    @pytest.mark.asyncio
+    async def test_stale_disconnect_leaves_new_connection(self):
+        """古い接続の後片付けは、再接続した新しい接続を切断しない"""
+        manager = ConnectionManager()
+        old_ws = FakeWebSocket()
+        old = await manager.connect(websocket=old_ws, user_id="dash1", connection_type="dashboard")  # type: ignore[arg-type]
+        new_ws = await _connect(manager, "dash1", "dashboard")
+
+        assert old_ws.closed is True
+        # The old handler's finally runs after the reconnect
+        assert await manager.disconnect("dash1", old) is False
+
+        sent = await manager.broadcast_to_dashboards(WebSocketMessage(event=EventType.ALERT, data={}))
+        await _drain()
+
+        assert sent == 1
+        assert manager.dashboard_count == 1
+        assert new_ws.closed is False
+        assert len(new_ws.sent) == 1
+
+
+class TestSendFrame:
+    """Tests for handler replies sent through the connection's outbox."""
+
+    @pytest.mark.asyncio
+    async def test_replies_are_ordered_with_broadcasts(self):
+        """返信フレームもブロードキャストと同じ送信キューを順番通りに通る"""
+        manager = ConnectionManager()
+        await _connect(manager, "dash1", "dashboard", metadata={"supports_batch": True})
+        dash = manager.get_connection("dash1")
+        assert dash is not None
+
+        await manager.broadcast_to_dashboards(WebSocketMessage(event=EventType.ALERT, data={}))
+        await manager.send_frame(dash, connection_manager.PONG_FRAME)
+        await _drain()
+
+        sent = dash.websocket.sent  # type: ignore[attr-defined]
+        assert len(sent) == 1
+        assert [message["event"] for message in json.loads(sent[0])] == ["alert", "pong"]
@@ -1,10 +1,16 @@
 """Unit tests for Dashboard WebSocket."""
 
+import asyncio
+
 import pytest
 from starlette.testclient import TestClient
 from starlette.websockets import WebSocketDisconnect
 
 from app.main import app
+from app.services.operator_manager import OperatorManager, OperatorSession
+from app.websocket import dashboard_ws
+from app.websocket.dashboard_ws import StatsCache
+from app.websocket.operator_ws import OperatorSessionRegistry
 
 
 @pytest.fixture
@@ -63,6 +69,8 @@ class TestDashboardSubscription:
             data = websocket.receive_json()
             assert data["event"] == "campaign_stats_updated"
             assert data["data"]["campaign_id"] == campaign_id
+            assert data["data"]["name"] == "Test Campaign"
+            assert data["data"]["total_leads"] == 0
 
     def test_get_operators_list(self, client: TestClient, auth_token: str):
         """オペレーター一覧取得"""
@@ -107,3 +115,103 @@ class TestDashboardPing:
             websocket.send_json({"action": "ping"})
             data = websocket.receive_json()
             assert data["event"] == "pong"
+
+
+class TestStatsCache:
+    """Tests for the short-lived campaign stats cache."""
+
+    @pytest.fixture
+    def queries(self, monkeypatch) -> list[str]:
+        calls: list[str] = []
+
+        async def fake_query(session, campaign_id: str):
+            calls.append(campaign_id)
+            await asyncio.sleep(0.01)
+            return None if campaign_id.startswith("missing") else {"campaign_id": campaign_id}
+
+        monkeypatch.setattr(dashboard_ws, "_query_campaign_stats", fake_query)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_query(self, queries: list[str]):
+        """同じキャンペーンへの同時リクエストは1回のクエリを共有する"""
+        cache = StatsCache()
+
+        results = await asyncio.gather(*(cache.get(None, "c1") for _ in range(5)))  # type: ignore[arg-type]
+
+        assert queries == ["c1"]
+        assert all(result == {"campaign_id": "c1"} for result in results)
+        assert cache._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_requeried(self, queries: list[str], monkeypatch):
+        """TTLを過ぎたら再クエリする"""
+        monkeypatch.setattr(dashboard_ws, "STATS_CACHE_TTL", 0.05)
+        cache = StatsCache()
+        await cache.get(None, "c1")  # type: ignore[arg-type]
+        await cache.get(None, "c1")  # type: ignore[arg-type]
+        assert queries == ["c1"]
+
+        await asyncio.sleep(0.06)
+        await cache.get(None, "c1")  # type: ignore[arg-type]
+        assert queries == ["c1", "c1"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_campaign_is_cached_and_entries_are_bounded(
+        self, queries: list[str], monkeypatch
+    ):
+        """存在しないIDも短時間キャッシュされ、エントリ数には上限がある"""
+        monkeypatch.setattr(dashboard_ws, "STATS_CACHE_SIZE", 3)
+        cache = StatsCache()
+
+        assert await cache.get(None, "missing-1") is None  # type: ignore[arg-type]
+        assert await cache.get(None, "missing-1") is None  # type: ignore[arg-type]
+        assert queries == ["missing-1"]
+
+        for i in range(10):
+            await cache.get(None, f"missing-{i}")  # type: ignore[arg-type]
+        assert len(cache._entries) <= 3
+        assert cache._inflight == {}
+
+
+class TestOperatorsList:
+    """Tests for the cached operator listing."""
+
+    def test_listing_follows_session_changes(self, monkeypatch):
+        """セッションの変更は一覧に自動で反映され、待機時間は毎回計算される"""
+        registry = OperatorSessionRegistry()
+        monkeypatch.setattr(dashboard_ws, "operator_sessions", registry)
+        session = OperatorSession(id="op1", name="Operator 1")
+        registry["op1"] = session
+
+        assert dashboard_ws.get_operators_list()[0]["status"] == "offline"
+
+        session.go_online()
+        operators = dashboard_ws.get_operators_list()
+
+        assert operators[0]["status"] == "available"
+        assert operators[0]["idle_duration_seconds"] >= 0.0
+        assert dashboard_ws.get_operators_list()[0]["idle_duration_seconds"] >= (
+            operators[0]["idle_duration_seconds"]
+        )
+
+    def test_listing_follows_changes_made_through_operator_manager(self, monkeypatch):
+        """OperatorManager経由の変更も一覧に反映され、削除後は追跡しない"""
+        registry = OperatorSessionRegistry()
+        monkeypatch.setattr(dashboard_ws, "operator_sessions", registry)
+        manager = OperatorManager()
+        session = OperatorSession(id="op1", name="Operator 1")
+        registry["op1"] = session
+        manager.add_operator(session)
+        session.go_online()
+        dashboard_ws.get_operators_list()  # Build the listing
+
+        manager.assign_call("op1", "CA123", "lead-1")
+        operators = dashboard_ws.get_operators_list()
+
+        assert operators[0]["status"] == "on_call"
+        assert operators[0]["current_call_sid"] == "CA123"
+        assert manager.on_call_count == 1
+
+        del registry["op1"]
+        assert session._change_listeners == [manager._on_operator_change]
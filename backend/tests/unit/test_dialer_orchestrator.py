@@ -1,9 +1,13 @@
 """Unit tests for DialerOrchestrator."""
 
+from types import SimpleNamespace
+
+import pytest
 
 from app.models.campaign import Campaign, CampaignStats
 from app.models.lead import Lead
-from app.services.dialer_orchestrator import DialerOrchestrator
+from app.services import dialer_orchestrator
+from app.services.dialer_orchestrator import DialerConfig, DialerOrchestrator
 
 
 class TestDialRatioCalculation:
@@ -57,6 +61,107 @@ class TestDialRatioCalculation:
         assert ratio <= 5.0
 
 
+class TestDialRatioPIDControl:
+    """Tests for the stateful PID dial ratio controller."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        fake = SimpleNamespace(now=0.0)
+        monkeypatch.setattr(
+            dialer_orchestrator, "time", SimpleNamespace(monotonic=lambda: fake.now)
+        )
+        return fake
+
+    def test_integral_accumulates_persistent_error(self, clock):
+        """放棄率が目標を上回り続けると積分項で比率がさらに下がる"""
+        orchestrator = DialerOrchestrator(ki=1.0, integral_limit=10.0)
+        stats = CampaignStats(connected_leads=94, abandoned_leads=6)
+
+        first = orchestrator.calculate_dial_ratio(stats, "c1")
+        clock.now = 5.0
+        second = orchestrator.calculate_dial_ratio(stats, "c1")
+        assert second < first
+
+    def test_integral_is_clamped(self, clock):
+        """積分項はanti-windupの上限で頭打ちになる"""
+        orchestrator = DialerOrchestrator(ki=1.0, integral_limit=0.1)
+        stats = CampaignStats(connected_leads=94, abandoned_leads=6)
+
+        orchestrator.calculate_dial_ratio(stats, "c1")
+        clock.now = 100.0
+        clamped = orchestrator.calculate_dial_ratio(stats, "c1")
+        clock.now = 1000.0
+        assert orchestrator.calculate_dial_ratio(stats, "c1") == clamped
+
+    def test_state_is_per_campaign(self, clock):
+        """キャンペーンごとに独立した状態を持つ"""
+        orchestrator = DialerOrchestrator()
+        stats = CampaignStats(connected_leads=94, abandoned_leads=6)
+
+        orchestrator.calculate_dial_ratio(stats, "c1")
+        clock.now = 5.0
+        orchestrator.calculate_dial_ratio(stats, "c1")
+        assert orchestrator.calculate_dial_ratio(stats, "c2") == orchestrator.calculate_dial_ratio(stats)
+
+    def test_reset_controller_clears_state(self, clock):
+        """reset_controllerで積分状態がリセットされる"""
+        orchestrator = DialerOrchestrator()
+        stats = CampaignStats(connected_leads=94, abandoned_leads=6)
+
+        first = orchestrator.calculate_dial_ratio(stats, "c1")
+        clock.now = 5.0
+        orchestrator.calculate_dial_ratio(stats, "c1")
+        orchestrator.reset_controller("c1")
+        assert orchestrator.calculate_dial_ratio(stats, "c1") == first
+
+    def test_restarted_campaign_starts_with_fresh_controller(self, clock):
+        """停止中のティックで状態が破棄され、再開後は積分なしで計算される"""
+        orchestrator = DialerOrchestrator(ki=1.0, integral_limit=10.0)
+        stats = CampaignStats(connected_leads=94, abandoned_leads=6)
+        campaign = Campaign(name="テスト")
+        campaign.add_lead(Lead(phone_number="+818011112222"))
+        campaign.start()
+
+        first = orchestrator.calculate_dial_ratio(stats, campaign.id)
+        clock.now = 5.0
+        assert orchestrator.calculate_dial_ratio(stats, campaign.id) < first
+
+        campaign.pause()
+        assert orchestrator.get_leads_to_dial(campaign, available_operators=1, pending_calls=0) == []
+        assert campaign.id not in orchestrator._controllers
+
+        campaign.resume()
+        clock.now = 600.0
+        assert orchestrator.calculate_dial_ratio(stats, campaign.id) == first
+
+    def test_integral_does_not_wind_up_at_campaign_cap(self, clock):
+        """キャンペーン上限で頭打ちの間は積分が蓄積しない"""
+        orchestrator = DialerOrchestrator(ki=1.0, integral_limit=10.0)
+        stats = CampaignStats(connected_leads=100, abandoned_leads=0)  # 目標を下回る
+
+        assert orchestrator.calculate_dial_ratio(stats, "c1", max_ratio=2.0) == 2.0
+        clock.now = 60.0
+        assert orchestrator.calculate_dial_ratio(stats, "c1", max_ratio=2.0) == 2.0
+        assert orchestrator._controllers["c1"].integral == 0.0
+
+    def test_stateless_ratio_is_proportional_only(self):
+        """campaign_idなしの計算は比例項のみで状態を持たない"""
+        orchestrator = DialerOrchestrator()
+        stats = CampaignStats(connected_leads=94, abandoned_leads=6)
+
+        ratio = orchestrator.calculate_dial_ratio(stats)
+        assert orchestrator.get_dialing_health(stats)["recommended_dial_ratio"] == ratio
+        assert orchestrator._controllers == {}
+
+        other = orchestrator.calculate_dial_ratio(CampaignStats(connected_leads=100, abandoned_leads=0))
+        assert other > ratio
+
+    def test_from_config(self):
+        """DialerConfigのゲインが反映される"""
+        orchestrator = DialerOrchestrator.from_config(DialerConfig(kp=5.0, ki=0.5, kd=0.1))
+        assert (orchestrator.kp, orchestrator.ki, orchestrator.kd) == (5.0, 0.5, 0.1)
+
+
 class TestCallsToMakeCalculation:
     """Tests for calculating number of calls to make."""
 
@@ -185,6 +290,19 @@ class TestAbandonRateTargets:
         orchestrator = DialerOrchestrator(target_abandon_rate=0.05)
         assert orchestrator.target_abandon_rate == 0.05
 
+    def test_changing_target_updates_thresholds(self):
+        """目標値を変更すると停止判定と推奨比率も追従する"""
+        orchestrator = DialerOrchestrator(target_abandon_rate=0.03)
+        stats = CampaignStats(connected_leads=93, abandoned_leads=7)  # 7%
+
+        assert orchestrator.should_pause_dialing(stats) is True
+        before = orchestrator.calculate_dial_ratio(stats)
+
+        orchestrator.target_abandon_rate = 0.05
+        assert orchestrator.should_pause_dialing(stats) is False
+        assert orchestrator.get_dialing_health(stats)["status"] == "warning"
+        assert orchestrator.calculate_dial_ratio(stats) > before
+
     def test_adjustment_factor_based_on_target(self):
         """目標値に基づいて調整係数を計算"""
         orchestrator = DialerOrchestrator(target_abandon_rate=0.03)
@@ -80,6 +80,50 @@ class TestCSVImport:
         data = response.json()
         assert data["imported_count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_import_csv_with_bom(
+        self, client: AsyncClient, auth_headers: dict, campaign_id: str
+    ):
+        """BOM付きCSV（UTF-8/UTF-16）をインポート"""
+        csv_content = "phone_number,name\n+818044444444,佐藤花子"
+        for encoded in (
+            csv_content.encode("utf-8-sig"),
+            csv_content.replace("+8180444", "+8180555").encode("utf-16"),
+        ):
+            files = {"file": ("leads.csv", encoded, "text/csv")}
+            response = await client.post(
+                f"/api/v1/campaigns/{campaign_id}/leads/import",
+                files=files,
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+            assert response.json()["imported_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_imported_leads_are_listed(
+        self, client: AsyncClient, auth_headers: dict, campaign_id: str
+    ):
+        """インポートしたリードが一覧に反映される"""
+        csv_content = "phone_number,name,company\n+818012340001,佐藤一郎,株式会社D\n+818012340002,,"
+        files = {"file": ("leads.csv", csv_content.encode("utf-8"), "text/csv")}
+
+        await client.post(
+            f"/api/v1/campaigns/{campaign_id}/leads/import",
+            files=files,
+            headers=auth_headers,
+        )
+        response = await client.get(
+            f"/api/v1/campaigns/{campaign_id}/leads",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        leads = {lead["phone_number"]: lead for lead in response.json()}
+        assert set(leads) == {"+818012340001", "+818012340002"}
+        assert leads["+818012340001"]["name"] == "佐藤一郎"
+        assert leads["+818012340001"]["company"] == "株式会社D"
+        assert leads["+818012340002"]["name"] is None
+        assert leads["+818012340002"]["status"] == "pending"
+
     @pytest.mark.asyncio
     async def test_import_skips_duplicates(
         self, client: AsyncClient, auth_headers: dict, campaign_id: str
@@ -108,6 +152,72 @@ class TestCSVImport:
         assert data["imported_count"] == 1
         assert data["skipped_count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_import_skips_duplicates_within_file(
+        self, client: AsyncClient, auth_headers: dict, campaign_id: str
+    ):
+        """同一ファイル内の重複電話番号をスキップ"""
+        csv_content = "phone_number,name\n+818012349999,First\n+818012349999,Second"
+        files = {"file": ("leads.csv", csv_content.encode("utf-8"), "text/csv")}
+
+        response = await client.post(
+            f"/api/v1/campaigns/{campaign_id}/leads/import",
+            files=files,
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported_count"] == 1
+        assert data["skipped_count"] == 1
+        assert data["errors"][0]["phone"] == "+818012349999"
+
+    @pytest.mark.asyncio
+    async def test_import_large_csv_across_batches(
+        self, client: AsyncClient, auth_headers: dict, campaign_id: str
+    ):
+        """複数バッチにまたがる大きなCSVをインポート"""
+        lines = ["phone_number,name"]
+        lines += [f"+8180{i:08d},Lead {i}" for i in range(2100)]
+        lines.append("+818000000005,Duplicate of an earlier batch")
+        files = {"file": ("leads.csv", "\n".join(lines).encode("utf-8"), "text/csv")}
+
+        response = await client.post(
+            f"/api/v1/campaigns/{campaign_id}/leads/import",
+            files=files,
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported_count"] == 2100
+        assert data["skipped_count"] == 1
+        assert data["errors"][0]["phone"] == "+818000000005"
+
+    @pytest.mark.asyncio
+    async def test_imported_leads_are_listed_in_csv_order(
+        self, client: AsyncClient, auth_headers: dict, campaign_id: str
+    ):
+        """インポートしたリードはCSVの順番で一覧に並ぶ（バッチをまたいでも）"""
+        phones = [f"+8190{i:08d}" for i in range(1500)]
+        csv_content = "phone_number\n" + "\n".join(phones)
+        files = {"file": ("leads.csv", csv_content.encode("utf-8"), "text/csv")}
+
+        response = await client.post(
+            f"/api/v1/campaigns/{campaign_id}/leads/import",
+            files=files,
+            headers=auth_headers,
+        )
+        assert response.json()["imported_count"] == len(phones)
+
+        listed: list[str] = []
+        for skip in range(0, len(phones), 500):
+            response = await client.get(
+                f"/api/v1/campaigns/{campaign_id}/leads",
+                params={"skip": skip, "limit": 500},
+                headers=auth_headers,
+            )
+            listed.extend(lead["phone_number"] for lead in response.json())
+        assert listed == phones
+
     @pytest.mark.asyncio
     async def test_import_skips_invalid_phones(
         self, client: AsyncClient, auth_headers: dict, campaign_id: str
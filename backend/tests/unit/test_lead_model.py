@@ -30,6 +30,12 @@ class TestLeadCreation:
         with pytest.raises(ValueError):
             Lead(phone_number="08011112222")  # +なし
 
+        with pytest.raises(ValueError):
+            Lead(phone_number="+818011112222\n")  # 末尾改行
+
+        with pytest.raises(ValueError):
+            Lead(phone_number="+81٨٠١١١١٢٢٢٢")  # 非ASCII数字
+
     def test_lead_can_have_optional_name(self):
         """名前はオプション"""
         lead = Lead(phone_number="+818011112222", name="田中太郎")
@@ -139,6 +145,15 @@ class TestLeadCallHistory:
         assert lead.last_called_at is not None
         assert lead.last_called_at >= before
 
+    def test_transition_shares_single_timestamp(self):
+        """1回の遷移で記録される日時はすべて同じ時刻になる"""
+        lead = Lead(phone_number="+818011112222")
+        lead.start_calling()
+        assert lead.updated_at == lead.last_called_at
+
+        lead.fail(reason="busy")
+        assert lead.call_history[0]["timestamp"] == lead.updated_at.isoformat()
+
 
 class TestLeadDNC:
     """Tests for Do Not Call functionality."""
@@ -1,7 +1,9 @@
 """Unit tests for OperatorManager."""
 
 from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 
+from app.services import operator_manager
 from app.services.operator_manager import (
     OperatorManager,
     OperatorSession,
@@ -59,6 +61,30 @@ class TestOperatorSession:
         assert operator.status == OperatorStatus.AVAILABLE
         assert operator.current_call_sid is None
 
+    def test_to_dict_uses_given_reference_time(self):
+        """to_dictは指定した基準時刻で待機時間を計算する"""
+        operator = OperatorSession(id="op1", name="田中")
+        operator.go_online()
+        assert operator.idle_since is not None
+
+        data = operator.to_dict(now=operator.idle_since + timedelta(seconds=42))
+        assert data["idle_duration_seconds"] == 42.0
+
+    def test_end_call_accumulates_talk_time(self, monkeypatch):
+        """通話時間が累計される"""
+        clock = SimpleNamespace(now=100.0)
+        monkeypatch.setattr(
+            operator_manager, "time", SimpleNamespace(monotonic=lambda: clock.now)
+        )
+        operator = OperatorSession(id="op1", name="田中")
+        operator.go_online()
+        operator.start_call(call_sid="CA123", lead_id="lead1")
+        clock.now = 145.5
+        operator.end_call()
+
+        assert operator.calls_handled == 1
+        assert operator.total_talk_time_seconds == 45
+
     def test_operator_can_go_on_break(self):
         """オペレーターは休憩できる"""
         operator = OperatorSession(id="op1", name="田中")
@@ -141,6 +167,47 @@ class TestOperatorRouting:
         assert selected is not None
         assert selected.id == "op2"
 
+    def test_selection_follows_changes_after_add(self):
+        """追加後の状態遷移・直接のステータス変更が選択に反映される"""
+        manager = OperatorManager()
+
+        op1 = OperatorSession(id="op1", name="田中")
+        op2 = OperatorSession(id="op2", name="鈴木")
+        manager.add_operator(op1)
+        manager.add_operator(op2)
+        op2.go_online()
+        op1.go_online()
+        assert manager.select_operator() is op2
+
+        op2.start_call(call_sid="CA123", lead_id="lead1")
+        assert manager.select_operator() is op1
+        assert manager.find_operator_by_call("CA123") is op2
+
+        op2.end_call()  # 待機し直したので op1 より後ろ
+        assert manager.select_operator() is op1
+        assert manager.find_operator_by_call("CA123") is None
+
+        op1.status = OperatorStatus.ON_BREAK
+        assert manager.select_operator() is op2
+        assert manager.on_break_count == 1
+
+    def test_operator_without_idle_since_is_least_idle(self):
+        """待機開始時刻のないオペレーターは待機時間0として扱う"""
+        manager = OperatorManager()
+
+        op1 = OperatorSession(id="op1", name="田中")
+        op1.status = OperatorStatus.AVAILABLE
+
+        op2 = OperatorSession(id="op2", name="鈴木")
+        op2.go_online()
+
+        manager.add_operator(op1)
+        manager.add_operator(op2)
+
+        selected = manager.select_operator()
+        assert selected is not None
+        assert selected.id == "op2"
+
 
 class TestOperatorManagerStats:
     """Tests for operator statistics."""
@@ -188,6 +255,41 @@ class TestOperatorManagerStats:
         available = manager.get_available_operators()
         assert len(available) == 2
 
+    def test_counts_follow_status_changes_after_add(self):
+        """追加後の状態変化がカウントに反映される"""
+        manager = OperatorManager()
+
+        op1 = OperatorSession(id="op1", name="田中")
+        manager.add_operator(op1)
+        assert manager.offline_count == 1
+
+        op1.go_online()
+        assert manager.available_count == 1
+        assert manager.offline_count == 0
+
+        op1.start_call(call_sid="CA123", lead_id="lead1")
+        assert manager.available_count == 0
+        assert manager.on_call_count == 1
+        assert manager.find_operator_by_call("CA123") is op1
+
+        op1.end_call()
+        assert manager.available_count == 1
+        assert manager.find_operator_by_call("CA123") is None
+
+    def test_removed_operator_is_no_longer_counted(self):
+        """削除したオペレーターはカウントされない"""
+        manager = OperatorManager()
+
+        op1 = OperatorSession(id="op1", name="田中")
+        op1.go_online()
+        manager.add_operator(op1)
+        manager.remove_operator("op1")
+
+        op1.start_call(call_sid="CA123", lead_id="lead1")
+        assert manager.available_count == 0
+        assert manager.on_call_count == 0
+        assert manager.find_operator_by_call("CA123") is None
+
 
 class TestOperatorManagerCallAssignment:
     """Tests for call assignment."""
@@ -5,6 +5,10 @@ from starlette.testclient import TestClient
 from starlette.websockets import WebSocketDisconnect
 
 from app.main import app
+from app.services.auth_service import get_user
+from app.services.operator_manager import OperatorStatus
+from app.websocket.connection_manager import manager
+from app.websocket.operator_ws import operator_sessions
 
 
 @pytest.fixture
@@ -167,3 +171,44 @@ class TestOperatorPing:
             websocket.send_json({"action": "ping"})
             data = websocket.receive_json()
             assert data["event"] == "pong"
+
+    def test_invalid_json_returns_error(self, client: TestClient, auth_token: str):
+        """不正なJSONにはエラーイベントを返し、接続は維持される"""
+        with client.websocket_connect(f"/ws/operator?token={auth_token}") as websocket:
+            websocket.receive_json()  # connected
+
+            websocket.send_text("{not json")
+            data = websocket.receive_json()
+            assert data["event"] == "error"
+            assert data["data"]["message"] == "Invalid JSON"
+
+            websocket.send_json({"action": "ping"})
+            assert websocket.receive_json()["event"] == "pong"
+
+
+class TestOperatorReconnect:
+    """Tests for reconnecting while the previous socket's handler is still running."""
+
+    def test_reconnect_keeps_new_connection_online(self, client: TestClient, auth_token: str):
+        """再接続後に古い接続が終了しても、新しい接続とオンライン状態は維持される"""
+        url = f"/ws/operator?token={auth_token}"
+        user_id = get_user("admin")["id"]  # type: ignore[index]
+
+        first = client.websocket_connect(url).__enter__()
+        first.receive_json()  # connected
+        first.send_json({"action": "set_status", "status": "available"})
+        first.receive_json()  # operator_status_changed
+
+        with client.websocket_connect(url) as second:
+            second.receive_json()  # connected
+
+            # The old socket's handler only finishes now, after the reconnect
+            first.__exit__(None, None, None)
+
+            second.send_json({"action": "ping"})
+            assert second.receive_json()["event"] == "pong"
+            assert manager.operator_count == 1
+            assert operator_sessions.get(user_id).status == OperatorStatus.AVAILABLE  # type: ignore[union-attr]
+
+        assert manager.operator_count == 0
+        assert operator_sessions.get(user_id).status == OperatorStatus.OFFLINE  # type: ignore[union-attr]
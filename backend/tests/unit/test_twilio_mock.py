@@ -0,0 +1,152 @@
+"""Unit tests for MockTwilioService."""
+
+import asyncio
+
+import pytest
+
+from app.services import twilio_mock
+from app.services.twilio_mock import MockTwilioService
+from app.services.twilio_protocol import AMDResult, CallStatus
+
+
+class TestMockSids:
+    """Tests for Twilio-like SID generation."""
+
+    def test_sid_format(self):
+        """SIDはプレフィックス + 32桁の16進数"""
+        service = MockTwilioService()
+        sid = service._generate_sid("CA")
+        assert sid.startswith("CA")
+        assert len(sid) == 34
+        int(sid[2:], 16)
+        assert service._generate_sid("CA") != sid
+
+
+class TestMockCallbacks:
+    """Tests for status / AMD callback notification."""
+
+    @pytest.mark.asyncio
+    async def test_sync_and_async_status_callbacks_are_notified(self):
+        """同期・非同期どちらのステータスコールバックも呼ばれる"""
+        service = MockTwilioService()
+        received: list[tuple[str, str, CallStatus]] = []
+
+        def on_status(call_sid: str, status: CallStatus) -> None:
+            received.append(("sync", call_sid, status))
+
+        async def on_status_async(call_sid: str, status: CallStatus) -> None:
+            received.append(("async", call_sid, status))
+
+        service.register_status_callback(on_status)
+        service.register_status_callback(on_status_async)
+
+        await service._notify_status_change("CA1", CallStatus.RINGING)
+
+        assert ("sync", "CA1", CallStatus.RINGING) in received
+        assert ("async", "CA1", CallStatus.RINGING) in received
+
+    @pytest.mark.asyncio
+    async def test_failing_callback_does_not_block_others(self):
+        """例外を出すコールバックがあっても他のコールバックは呼ばれる"""
+        service = MockTwilioService()
+        received: list[AMDResult] = []
+
+        def broken(call_sid: str, result: AMDResult) -> None:
+            raise RuntimeError("boom")
+
+        async def broken_async(call_sid: str, result: AMDResult) -> None:
+            raise RuntimeError("boom")
+
+        async def on_amd(call_sid: str, result: AMDResult) -> None:
+            received.append(result)
+
+        service.register_amd_callback(broken)
+        service.register_amd_callback(broken_async)
+        service.register_amd_callback(on_amd)
+
+        await service._notify_amd_result("CA1", AMDResult.MACHINE_START)
+
+        assert received == [AMDResult.MACHINE_START]
+
+    @pytest.mark.asyncio
+    async def test_sync_callbacks_after_failure_still_run_in_order(self):
+        """同期コールバックの途中で例外が出ても後続が順番に呼ばれる"""
+        service = MockTwilioService()
+        calls: list[int] = []
+
+        def broken(call_sid: str, status: CallStatus) -> None:
+            calls.append(2)
+            raise RuntimeError("boom")
+
+        service.register_status_callback(lambda sid, status: calls.append(1))
+        service.register_status_callback(broken)
+        service.register_status_callback(broken)
+        service.register_status_callback(lambda sid, status: calls.append(3))
+
+        await service._notify_status_change("CA1", CallStatus.RINGING)
+
+        assert calls == [1, 2, 2, 3]
+
+
+class TestMockCallProgression:
+    """Tests for simulated call progression."""
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        monkeypatch.setattr(twilio_mock, "QUEUED_TO_RINGING_DELAY", 0.01)
+        return MockTwilioService(call_answer_delay=0.01, amd_detection_delay=0.01)
+
+    @pytest.mark.asyncio
+    async def test_calls_progress_to_amd_result(self, service: MockTwilioService):
+        """発信がRINGING→IN_PROGRESS→AMD判定まで進む"""
+        statuses: list[tuple[str, CallStatus]] = []
+        service.register_status_callback(lambda sid, status: statuses.append((sid, status)))
+
+        first = await service.make_call(to="+818011112222", from_="+815000000000")
+        second = await service.make_call(
+            to="+818033334444", from_="+815000000000", machine_detection=False
+        )
+        await asyncio.sleep(0.2)
+
+        first_call = service.get_call(first.call_sid)
+        second_call = service.get_call(second.call_sid)
+        assert first_call is not None and second_call is not None
+        assert first_call.status == CallStatus.IN_PROGRESS
+        assert first_call.amd_result == AMDResult.HUMAN
+        assert second_call.status == CallStatus.IN_PROGRESS
+        assert second_call.amd_result is None
+        assert (first.call_sid, CallStatus.RINGING) in statuses
+
+    @pytest.mark.asyncio
+    async def test_hung_up_call_stops_progressing(self, service: MockTwilioService):
+        """切断された発信はそれ以上進まない"""
+        result = await service.make_call(to="+818011112222", from_="+815000000000")
+        await service.hangup_call(result.call_sid)
+        await asyncio.sleep(0.1)
+
+        call = service.get_call(result.call_sid)
+        assert call is not None
+        assert call.status == CallStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_slow_callback_does_not_delay_other_calls(self, service: MockTwilioService):
+        """あるコールの遅いコールバックが他のコールの進行を止めない"""
+        slow_sids: set[str] = set()
+
+        async def on_status(call_sid: str, status: CallStatus) -> None:
+            if call_sid in slow_sids:
+                await asyncio.sleep(1.0)
+
+        service.register_status_callback(on_status)
+
+        slow = await service.make_call(to="+818011112222", from_="+815000000000")
+        slow_sids.add(slow.call_sid)
+        fast = await service.make_call(to="+818033334444", from_="+815000000000")
+        await asyncio.sleep(0.2)
+
+        slow_call = service.get_call(slow.call_sid)
+        fast_call = service.get_call(fast.call_sid)
+        assert slow_call is not None and fast_call is not None
+        assert slow_call.status == CallStatus.RINGING
+        assert fast_call.amd_result == AMDResult.HUMAN
+        service.reset()
@@ -131,6 +131,19 @@ class TestAMDWebhook:
         content = response.text
         assert "Conference" in content or "Dial" in content or "xml" in content.lower()
 
+    @pytest.mark.asyncio
+    async def test_amd_human_conference_room_name(self, client: AsyncClient):
+        """human検出時の会議室名は余白なしの room-{CallSid}"""
+        response = await client.post(
+            "/webhooks/twilio/amd",
+            data={
+                "CallSid": "CA1234567890",
+                "AnsweredBy": "human",
+            },
+        )
+        assert response.headers["content-type"].startswith("application/xml")
+        assert ">room-CA1234567890</Conference>" in response.text
+
     @pytest.mark.asyncio
     async def test_amd_machine_start(self, client: AsyncClient):
         """machine_start検出を処理（留守電の開始）"""
@@ -12,6 +12,8 @@ interface UseWebSocketOptions {
   onConnect?: () => void;
   onDisconnect?: () => void;
   onError?: (error: Event) => void;
+  // Ask the server to coalesce queued messages into JSON-array frames
+  batch?: boolean;
   reconnectInterval?: number;
   maxReconnectAttempts?: number;
 }
@@ -30,6 +32,7 @@ export function useWebSocket({
   onConnect,
   onDisconnect,
   onError,
+  batch = false,
   reconnectInterval = 3000,
   maxReconnectAttempts = 5,
 }: UseWebSocketOptions): UseWebSocketReturn {
@@ -47,7 +50,7 @@ export function useWebSocket({
       wsRef.current.close();
     }
 
-    const wsUrl = `${url}?token=${token}`;
+    const wsUrl = `${url}?token=${token}${batch ? "&batch=true" : ""}`;
     const ws = new WebSocket(wsUrl);
 
     ws.onopen = () => {
@@ -58,9 +61,12 @@ export function useWebSocket({
 
     ws.onmessage = (event) => {
       try {
-        const message = JSON.parse(event.data) as WSMessage;
-        setLastMessage(message);
-        onMessage?.(message);
+        const parsed = JSON.parse(event.data) as WSMessage | WSMessage[];
+        const messages = Array.isArray(parsed) ? parsed : [parsed];
+        for (const message of messages) {
+          onMessage?.(message);
+        }
+        setLastMessage(messages[messages.length - 1] ?? null);
       } catch {
         console.error("Failed to parse WebSocket message:", event.data);
       }
@@ -84,7 +90,7 @@ export function useWebSocket({
     };
 
     wsRef.current = ws;
-  }, [url, token, onMessage, onConnect, onDisconnect, onError, reconnectInterval, maxReconnectAttempts]);
+  }, [url, token, batch, onMessage, onConnect, onDisconnect, onError, reconnectInterval, maxReconnectAttempts]);
 
   const disconnect = useCallback(() => {
     if (reconnectTimeoutRef.current) {
@@ -193,5 +199,6 @@ export function useDashboardWebSocket(
     url: wsUrl,
     token,
     onMessage: handleMessage,
+    batch: true,
   });
 }